@@ -0,0 +1,79 @@
+# src/background.py
+import queue
+import threading
+
+
+class Cancelled(Exception):
+    """Raised inside a background job once its task has been cancelled"""
+
+
+class BackgroundTask:
+    """Runs job(task) on a worker thread and hands its outcome back to the Tk main thread.
+
+    The job reports progress with task.report() and calls task.check_cancelled() at safe
+    points; both only touch a queue and an Event. The main thread polls the queue with
+    root.after, so every callback (on_progress, on_done, on_cancel, on_error) runs on the
+    Tk thread and may update widgets.
+    """
+
+    def __init__(self, root, job, on_done, on_progress=None, on_cancel=None, on_error=None, poll_interval=50):
+        self.root = root
+        self.job = job
+        self.on_done = on_done
+        self.on_progress = on_progress
+        self.on_cancel = on_cancel
+        self.on_error = on_error
+        self.poll_interval = poll_interval  # Milliseconds between queue polls
+        self.events = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.last_fraction = -1.0
+        self.finished = False
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+        self.root.after(self.poll_interval, self.poll)
+        return self
+
+    def run(self):
+        """Worker thread: run the job and queue its outcome"""
+        try:
+            result = self.job(self)
+        except Cancelled:
+            self.events.put(("cancelled", None))
+        except Exception as error:  # Shown to the user by the main thread
+            self.events.put(("error", error))
+        else:
+            self.events.put(("done", result))
+
+    def report(self, fraction, message=""):
+        """Queue a progress update (0..1); updates under 1% apart are dropped"""
+        if fraction - self.last_fraction >= 0.01 or fraction >= 1:
+            self.last_fraction = fraction
+            self.events.put(("progress", (fraction, message)))
+
+    def check_cancelled(self):
+        if self.cancel_event.is_set():
+            raise Cancelled()
+
+    def cancel(self):
+        """Ask the job to stop at its next check_cancelled()"""
+        self.cancel_event.set()
+
+    def poll(self):
+        """Main thread: deliver queued events, and keep polling until the job has finished"""
+        while True:
+            try:
+                kind, payload = self.events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                if self.on_progress is not None:
+                    self.on_progress(*payload)
+                continue
+            self.finished = True
+            callback = {"done": self.on_done, "cancelled": self.on_cancel, "error": self.on_error}[kind]
+            if callback is not None:
+                callback(payload) if kind != "cancelled" else callback()
+            return
+        self.root.after(self.poll_interval, self.poll)
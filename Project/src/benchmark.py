@@ -0,0 +1,187 @@
+# src/benchmark.py
+"""Scaling benchmarks for every Scheduler policy, compared against a stored baseline.
+
+Each policy runs on synthetic workloads of 10 to 10^6 processes under several arrival
+densities and burst distributions. Wall time, peak memory and execution log size are
+written as JSON; with a baseline, any case that got slower or bigger than the tolerances
+allow (or whose log size changed) is reported and the run exits with status 1:
+
+    python benchmark.py --save-baseline          # record benchmark_baseline.json
+    python benchmark.py -o results.json          # compare against it
+    python benchmark.py --quick                  # sizes up to 10^4 only
+"""
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from process import Process
+from scheduler import Scheduler
+
+# (name, method, args) of every policy benchmarked
+POLICIES = [
+    ("fcfs", "fcfs", ()),
+    ("sjf_non_preemptive", "sjf_non_preemptive", ()),
+    ("sjf_preemptive", "sjf_preemptive", ()),
+    ("priority_scheduling", "priority_scheduling", ()),
+    ("priority_preemptive", "priority_preemptive", ()),
+    ("round_robin_q4", "round_robin", (4,)),
+    ("mlfq", "mlfq", ()),
+]
+
+SIZES = [10, 100, 1000, 10 ** 4, 10 ** 5, 10 ** 6]
+QUICK_SIZES = [10, 100, 1000, 10 ** 4]
+
+# Mean gap between arrivals as a multiple of the mean burst: dense arrivals build long
+# ready queues, sparse ones leave the CPU idle most of the time
+ARRIVAL_DENSITIES = {"dense": 0.1, "balanced": 1.1, "sparse": 4.0}
+
+MEAN_BURST = 10
+
+# (arrival density, burst distribution) pairs benchmarked at every size
+SCENARIOS = [("dense", "uniform"), ("balanced", "exponential"), ("balanced", "heavy_tail"), ("sparse", "uniform")]
+
+# A case regresses when it is this much slower / bigger than its baseline; times under
+# MIN_TIME seconds are too noisy to compare
+TIME_TOLERANCE = 1.5
+MEMORY_TOLERANCE = 1.25
+MIN_TIME = 0.005
+
+
+def burst_time(distribution, rng):
+    """One burst drawn from a distribution with a mean of about MEAN_BURST"""
+    if distribution == "uniform":
+        return rng.randint(1, 2 * MEAN_BURST - 1)
+    if distribution == "exponential":
+        return max(1, round(rng.expovariate(1 / MEAN_BURST)))
+    if distribution == "heavy_tail":
+        # Pareto with shape 1.5: mostly short jobs and a few very long ones
+        return max(1, min(100 * MEAN_BURST, round(rng.paretovariate(1.5) * MEAN_BURST / 3)))
+    raise ValueError(f"Unknown burst distribution: {distribution}")
+
+
+def synthetic_workload(size, density, distribution, seed=0):
+    """(pid, arrival, burst, priority) specs with exponential inter-arrival gaps"""
+    rng = random.Random(f"{seed}-{size}-{density}-{distribution}")
+    mean_gap = ARRIVAL_DENSITIES[density] * MEAN_BURST
+    arrival = 0
+    specs = []
+    for pid in range(size):
+        specs.append((pid, int(arrival), burst_time(distribution, rng), rng.randint(1, 5)))
+        arrival += rng.expovariate(1 / mean_gap)
+    return specs
+
+
+def run_case(specs, method, args, measure_memory=False):
+    """Run one policy on fresh processes; returns (seconds, peak traced bytes or None, log segments)"""
+    processes = [Process(*spec) for spec in specs]
+    scheduler = Scheduler(processes)
+    gc.collect()
+    if measure_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    getattr(scheduler, method)(*args)
+    elapsed = time.perf_counter() - start
+    peak = None
+    if measure_memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return elapsed, peak, len(scheduler.execution_log)
+
+
+def run_benchmarks(sizes=SIZES, policies=POLICIES, scenarios=SCENARIOS, repeat=3, memory=True, seed=0):
+    """Benchmark every (policy, scenario, size); returns one result dict per case.
+
+    Wall time is the best of `repeat` runs (one run from 10^5 processes on). Peak memory
+    is traced in a separate run, since tracemalloc slows the engines down considerably.
+    """
+    results = []
+    for size in sizes:
+        for density, distribution in scenarios:
+            specs = synthetic_workload(size, density, distribution, seed)
+            for name, method, args in policies:
+                runs = [run_case(specs, method, args) for _ in range(repeat if size < 10 ** 5 else 1)]
+                seconds = min(run[0] for run in runs)
+                peak = run_case(specs, method, args, measure_memory=True)[1] if memory else None
+                results.append({
+                    "case": f"{name}/{density}-{distribution}/{size}",
+                    "policy": name,
+                    "arrivals": density,
+                    "bursts": distribution,
+                    "processes": size,
+                    "seconds": seconds,
+                    "peak_bytes": peak,
+                    "log_segments": runs[0][2],
+                })
+                print(f"{results[-1]['case']:<50} {seconds * 1000:10.1f} ms"
+                      + (f" {peak / 2 ** 20:9.1f} MiB" if peak is not None else "")
+                      + f" {runs[0][2]:>9} segments", file=sys.stderr)
+    return results
+
+
+def compare(results, baseline, time_tolerance=TIME_TOLERANCE, memory_tolerance=MEMORY_TOLERANCE):
+    """Regressions of results against a baseline, as (case, message) pairs"""
+    previous = {entry["case"]: entry for entry in baseline["results"]}
+    regressions = []
+    for entry in results:
+        old = previous.get(entry["case"])
+        if old is None:
+            continue
+        if entry["log_segments"] != old["log_segments"]:
+            regressions.append((entry["case"], f"log size changed: {old['log_segments']} -> {entry['log_segments']}"))
+        if max(entry["seconds"], old["seconds"]) >= MIN_TIME and entry["seconds"] > old["seconds"] * time_tolerance:
+            regressions.append((entry["case"], f"wall time {old['seconds']:.4f}s -> {entry['seconds']:.4f}s"))
+        if (entry["peak_bytes"] is not None and old.get("peak_bytes") is not None
+                and entry["peak_bytes"] > old["peak_bytes"] * memory_tolerance):
+            regressions.append((entry["case"], f"peak memory {old['peak_bytes']} -> {entry['peak_bytes']} bytes"))
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark every Scheduler policy and compare with a baseline.")
+    parser.add_argument("--quick", action="store_true", help=f"only sizes up to {QUICK_SIZES[-1]}")
+    parser.add_argument("--max-size", type=int, help="skip workloads larger than this")
+    parser.add_argument("--policy", action="append", choices=[name for name, _, _ in POLICIES],
+                        help="benchmark only this policy (repeatable)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case below 10^5 processes (best is kept)")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc peak-memory runs")
+    parser.add_argument("-o", "--output", help="write the results as JSON")
+    parser.add_argument("--baseline", default="benchmark_baseline.json", help="baseline to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the baseline")
+    parser.add_argument("--time-tolerance", type=float, default=TIME_TOLERANCE)
+    parser.add_argument("--memory-tolerance", type=float, default=MEMORY_TOLERANCE)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    sizes = [size for size in (QUICK_SIZES if args.quick else SIZES) if args.max_size is None or size <= args.max_size]
+    policies = [policy for policy in POLICIES if not args.policy or policy[0] in args.policy]
+    results = run_benchmarks(sizes, policies, repeat=args.repeat, memory=not args.no_memory)
+    report = {"python": platform.python_version(), "machine": platform.machine(), "results": results}
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(report, file, indent=2)
+        print(f"Saved baseline to {args.baseline}", file=sys.stderr)
+        return 0
+    try:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+    except FileNotFoundError:
+        print(f"No baseline at {args.baseline}; run with --save-baseline to record one", file=sys.stderr)
+        return 0
+    regressions = compare(results, baseline, args.time_tolerance, args.memory_tolerance)
+    for case, message in regressions:
+        print(f"REGRESSION {case}: {message}", file=sys.stderr)
+    print(f"{len(results)} cases, {len(regressions)} regressions", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
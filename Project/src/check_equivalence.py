@@ -0,0 +1,250 @@
+# src/check_equivalence.py
+"""Seeded check that the event-driven engines match the original tick-by-tick schedulers.
+
+The reference functions below are the straightforward one-unit-per-step versions the
+engines replaced (with Round Robin in textbook order, MLFQ scanning every level each
+step, and preemptive priority aging every waiting process each step). The SMP engine on
+one core is checked against the single-CPU schedulers as well. Run
+`python check_equivalence.py`; it exits with status 1 and prints the first mismatches if
+any policy drifts.
+"""
+import random
+import sys
+from collections import deque
+from process import Process
+from scheduler import Scheduler
+from smp import POLICY_ORDER, QUEUE_MODES, SMPEngine
+
+
+def reference_sjf_preemptive(processes):
+    """Shortest remaining time first, one time unit per step, stable sort of the ready queue"""
+    remaining = sorted(processes, key=lambda p: p.arrival_time)
+    ready, current_time, started = [], 0, 0
+    while remaining or ready:
+        while remaining and remaining[0].arrival_time <= current_time:
+            ready.append(remaining.pop(0))
+        if not ready:
+            current_time += 1
+            continue
+        ready.sort(key=lambda p: p.remaining_time)
+        process = ready[0]
+        if process.start_time == -1:
+            process.start_time = current_time
+            process.response_time = current_time - process.arrival_time
+            started += 1
+        process.remaining_time -= 1
+        current_time += 1
+        if process.remaining_time == 0:
+            process.completion_time = current_time
+            process.turnaround_time = current_time - process.arrival_time
+            process.waiting_time = process.turnaround_time - process.burst_time
+            ready.remove(process)
+    return started  # The original counted a context switch whenever a process first started
+
+
+def reference_non_preemptive(processes, key, order_key):
+    """Pick min(key) among arrived processes, scanning the whole remaining list each dispatch"""
+    remaining = sorted(processes, key=order_key)
+    current_time = 0
+    while remaining:
+        available = [p for p in remaining if p.arrival_time <= current_time]
+        if not available:
+            current_time += 1
+            continue
+        process = min(available, key=key)
+        process.start_time = current_time
+        process.response_time = current_time - process.arrival_time
+        process.waiting_time = current_time - process.arrival_time
+        current_time += process.burst_time
+        process.completion_time = current_time
+        process.turnaround_time = current_time - process.arrival_time
+        remaining.remove(process)
+    return 0
+
+
+def reference_round_robin(processes, quantum):
+    """Textbook Round Robin: arrivals during a slice queue ahead of the preempted process"""
+    arrivals = deque(sorted(processes, key=lambda p: p.arrival_time))
+    ready, current_time, switches, done = deque(), 0, 0, 0
+    while done < len(processes):
+        while arrivals and arrivals[0].arrival_time <= current_time:
+            ready.append(arrivals.popleft())
+        if not ready:
+            current_time += 1
+            continue
+        process = ready.popleft()
+        if process.start_time == -1:
+            process.start_time = current_time
+            process.response_time = current_time - process.arrival_time
+        time_slice = min(quantum, process.remaining_time)
+        process.remaining_time -= time_slice
+        current_time += time_slice
+        while arrivals and arrivals[0].arrival_time <= current_time:
+            ready.append(arrivals.popleft())
+        if process.remaining_time:
+            if ready:
+                switches += 1
+            ready.append(process)
+        else:
+            process.completion_time = current_time
+            process.turnaround_time = current_time - process.arrival_time
+            process.waiting_time = process.turnaround_time - process.burst_time
+            done += 1
+    return switches
+
+
+def reference_mlfq(processes, quanta, boost_interval):
+    """Multilevel feedback queue, one time unit per step, scanning every level for the highest"""
+    arrivals = deque(sorted(processes, key=lambda p: p.arrival_time))
+    levels = [deque() for _ in quanta]
+    level_of, used = {}, {}
+    running, expired, current_time, switches, done = None, False, 0, 0, 0
+    while done < len(processes):
+        while arrivals and arrivals[0].arrival_time <= current_time:
+            process = arrivals.popleft()
+            levels[0].append(process)
+            level_of[process], used[process] = 0, 0
+        if boost_interval and current_time and current_time % boost_interval == 0:
+            for level in levels[1:]:
+                levels[0].extend(level)
+                level.clear()
+            for process in list(levels[0]) + ([running] if running else []):
+                level_of[process], used[process] = 0, 0
+            expired = False
+        waiting = [index for index, level in enumerate(levels) if level]
+        if running and waiting:
+            # After an expired quantum the process queues behind its new level; preempted
+            # mid-quantum it goes back to the front of its level
+            if expired and waiting[0] <= level_of[running]:
+                levels[level_of[running]].append(running)
+                running, switches = None, switches + 1
+            elif waiting[0] < level_of[running]:
+                levels[level_of[running]].appendleft(running)
+                running, switches = None, switches + 1
+        expired = False
+        if running is None:
+            waiting = [index for index, level in enumerate(levels) if level]
+            if not waiting:
+                current_time += 1
+                continue
+            running = levels[waiting[0]].popleft()
+            if running.start_time == -1:
+                running.start_time = current_time
+                running.response_time = current_time - running.arrival_time
+        running.remaining_time -= 1
+        used[running] += 1
+        current_time += 1
+        if running.remaining_time == 0:
+            running.completion_time = current_time
+            running.turnaround_time = current_time - running.arrival_time
+            running.waiting_time = running.turnaround_time - running.burst_time
+            running, done = None, done + 1
+        elif used[running] >= quanta[level_of[running]]:
+            level_of[running], used[running] = min(level_of[running] + 1, len(quanta) - 1), 0
+            expired = True
+    return switches
+
+
+def reference_priority_preemptive(processes, aging):
+    """Preemptive priority with aging, one time unit per step, scanning every waiting process"""
+    arrivals = deque(sorted(processes, key=lambda p: (p.arrival_time, p.priority)))
+    effective, tie, aging_due, waiting = {}, {}, {}, []
+    running, current_time, switches, done, order, preempt_order = None, 0, 0, 0, 0, 0
+    never = float("inf")
+    while done < len(processes):
+        while arrivals and arrivals[0].arrival_time <= current_time:
+            process = arrivals.popleft()
+            effective[process], tie[process] = process.priority, order
+            aging_due[process] = process.arrival_time + aging if aging and process.priority > 0 else never
+            waiting.append(process)
+            order += 1
+        for process in waiting:
+            if aging_due[process] <= current_time:
+                effective[process] -= 1
+                aging_due[process] = aging_due[process] + aging if effective[process] > 0 else never
+        if running and waiting and min(effective[p] for p in waiting) < effective[running]:
+            # The preempted process goes ahead of waiting processes with the same priority
+            preempt_order -= 1
+            tie[running] = preempt_order
+            aging_due[running] = current_time + aging if aging and effective[running] > 0 else never
+            waiting.append(running)
+            running, switches = None, switches + 1
+        if running is None:
+            if not waiting:
+                current_time += 1
+                continue
+            running = min(waiting, key=lambda p: (effective[p], tie[p]))
+            waiting.remove(running)
+            aging_due[running] = never  # A running process does not age
+            if running.start_time == -1:
+                running.start_time = current_time
+                running.response_time = current_time - running.arrival_time
+        running.remaining_time -= 1
+        current_time += 1
+        if running.remaining_time == 0:
+            running.completion_time = current_time
+            running.turnaround_time = current_time - running.arrival_time
+            running.waiting_time = running.turnaround_time - running.burst_time
+            running, done = None, done + 1
+    return switches
+
+
+CHECKS = [
+    ("fcfs", (), lambda ps: reference_non_preemptive(ps, lambda p: 0, lambda p: p.arrival_time)),
+    ("sjf_non_preemptive", (), lambda ps: reference_non_preemptive(ps, lambda p: p.burst_time, lambda p: p.arrival_time)),
+    ("sjf_preemptive", (), reference_sjf_preemptive),
+    ("priority_scheduling", (), lambda ps: reference_non_preemptive(
+        ps, lambda p: p.priority, lambda p: (p.arrival_time, p.priority))),
+] + [("round_robin", (quantum,), lambda ps, q=quantum: reference_round_robin(ps, q)) for quantum in (1, 2, 3, 5)] + [
+    ("mlfq", (quanta, boost), lambda ps, q=quanta, b=boost: reference_mlfq(ps, q, b))
+    for quanta, boost in (((2, 4, 8), 50), ((1, 2), 5), ((1, 2, 4), 7), ((3,), None))
+] + [
+    ("priority_preemptive", (aging,), lambda ps, a=aging: reference_priority_preemptive(ps, a))
+    for aging in (None, 1, 3, 7)
+]
+
+# Single-CPU Scheduler methods the SMP engine must reproduce on one core, in either queue layout
+SMP_CHECKS = [(policy, ()) for policy in POLICY_ORDER if policy != "round_robin"] + [
+    ("round_robin", (quantum,)) for quantum in (1, 2, 3, 5)
+]
+
+
+def outcome(processes):
+    return sorted((p.pid, p.start_time, p.completion_time, p.waiting_time, p.turnaround_time, p.response_time)
+                  for p in processes)
+
+
+def run_checks(workloads=1000, seed=0):
+    """Compare every policy with its reference on seeded random workloads; returns the mismatches"""
+    rng = random.Random(seed)
+    mismatches = []
+    for _ in range(workloads):
+        specs = [(f"P{i}", rng.randint(0, 15), rng.randint(1, 8), rng.randint(1, 4))
+                 for i in range(rng.randint(1, 9))]
+        for method, args, reference in CHECKS:
+            expected_processes = [Process(*spec) for spec in specs]
+            expected_switches = reference(expected_processes)
+            processes = [Process(*spec) for spec in specs]
+            scheduler = Scheduler(processes)
+            getattr(scheduler, method)(*args)
+            if (outcome(processes), scheduler.context_switches) != (outcome(expected_processes), expected_switches):
+                mismatches.append((method, args, specs))
+        for method, args in SMP_CHECKS:
+            expected_processes = [Process(*spec) for spec in specs]
+            getattr(Scheduler(expected_processes), method)(*args)
+            order = (lambda p: (p.arrival_time, p.priority)) if method == "priority_scheduling" \
+                else (lambda p: p.arrival_time)
+            for queues in QUEUE_MODES:
+                processes = sorted((Process(*spec) for spec in specs), key=order)
+                SMPEngine(1, method, *args, queues=queues).run(processes)
+                if outcome(processes) != outcome(expected_processes):
+                    mismatches.append((f"smp {method}", args + (queues,), specs))
+    return mismatches
+
+
+if __name__ == "__main__":
+    failures = run_checks()
+    for method, args, specs in failures[:5]:
+        print(f"Mismatch in {method}{args} for workload {specs}")
+    print(f"{len(failures)} mismatches")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,190 @@
+# src/cli.py
+"""Headless batch runner: schedule a workload file and write the metrics as CSV or JSON.
+
+Only the scheduling core is imported (never tkinter, matplotlib or visual), so it starts
+quickly on servers without a display. Examples:
+
+    python cli.py workload.csv --all -o metrics.json
+    python cli.py workload.jsonl.gz -a round_robin -q 4 --per-process
+    python cli.py workload.csv -a sjf_preemptive --cores 32 --queues per_core
+    generate_jobs | python cli.py - --input-format jsonl -a fcfs -a sjf_preemptive
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+from instrumentation import COUNTERS
+from process import Process
+from process_table import average_metrics, starvation_metrics
+from scheduler import RECORD_NONE, Scheduler, COMPARISON_RUNS
+from smp import POLICY_ORDER, QUEUE_GLOBAL, QUEUE_MODES
+from traces import RESULT_FIELDS, read_records
+
+# Scheduler methods selectable with --algorithm
+ALGORITHMS = ("fcfs", "sjf_non_preemptive", "sjf_preemptive", "priority_scheduling", "priority_preemptive",
+              "round_robin", "mlfq")
+
+# Columns of the per-algorithm summary
+SUMMARY_FIELDS = ("algorithm", "method", "quantum", "processes", "avg_waiting_time",
+                  "avg_turnaround_time", "avg_response_time", "context_switches",
+                  "max_waiting_time", "max_waiting_time_by_priority")
+
+# Extra summary columns of multi-core runs
+SMP_FIELDS = ("cores", "queues", "avg_utilization")
+
+
+def read_workload(source, input_format="csv"):
+    """(pid, arrival, burst, priority) tuples from a CSV/JSONL workload file, or from stdin for '-'"""
+    if source == "-":
+        if input_format == "csv":
+            records = csv.DictReader(sys.stdin)
+        else:
+            records = (json.loads(line) for line in sys.stdin if line.strip())
+    else:
+        records = read_records(source)
+    specs = []
+    for line_number, record in enumerate(records, start=1):
+        try:
+            specs.append((record["pid"], int(record["arrival_time"]), int(record["burst_time"]),
+                          int(record.get("priority") or 0)))
+        except (KeyError, TypeError, ValueError) as error:
+            raise ValueError(f"{source}: job {line_number}: invalid record {record!r}") from error
+    return specs
+
+
+def selected_runs(algorithms, quantum, cores=1):
+    """(name, method, quantum) runs for the chosen methods; all comparison runs when none are chosen.
+
+    With more than one core, comparison runs of single-CPU policies (MLFQ, preemptive
+    priority) are left out.
+    """
+    if not algorithms:
+        return [run for run in COMPARISON_RUNS if cores == 1 or run[1] in POLICY_ORDER]
+    runs = []
+    for method in algorithms:
+        if method == "round_robin":
+            runs.append((f"RR (Quantum {quantum})", method, quantum))
+        else:
+            runs.append((method, method, None))
+    return runs
+
+
+def run_batch(specs, runs, stats=False, cores=1, queues=QUEUE_GLOBAL):
+    """Run each (name, method, quantum) on its own processes; yields (summary row, processes).
+
+    With stats, each row also carries the run's instrumentation counters and scheduling time;
+    with more than one core, the core count, queue layout and average core utilization.
+    """
+    for name, method, quantum in runs:
+        processes = [Process(*spec) for spec in specs]
+        # Only the metrics are written
+        scheduler = Scheduler(processes, recording=RECORD_NONE, cores=cores, queues=queues)
+        if quantum is not None:
+            getattr(scheduler, method)(quantum)
+        else:
+            getattr(scheduler, method)()
+        row = {"algorithm": name, "method": method, "quantum": quantum, "processes": len(processes)}
+        row.update(average_metrics(processes))
+        row["context_switches"] = scheduler.context_switches
+        row.update(starvation_metrics(processes))
+        if cores > 1:
+            row.update(cores=cores, queues=queues, avg_utilization=sum(scheduler.utilization) / cores)
+        if stats:
+            for counter in COUNTERS:
+                row[counter] = getattr(scheduler.stats, counter)
+            row["schedule_seconds"] = scheduler.stats.timers["schedule"]
+        yield row, processes
+
+
+def write_output(file, output_format, batch, per_process, stats=False, smp=False):
+    """Write summary rows (or one row per process with per_process) as CSV or JSON.
+
+    stats and smp add the columns run_batch fills in for --stats and for multi-core runs.
+    """
+    if output_format == "json":
+        rows = []
+        for row, processes in batch:
+            if per_process:
+                row["results"] = [{field: getattr(p, field) for field in RESULT_FIELDS} for p in processes]
+            rows.append(row)
+        json.dump(rows, file, indent=2)
+        file.write("\n")
+        return
+    writer = csv.writer(file)
+    summary_fields = SUMMARY_FIELDS + (SMP_FIELDS if smp else ())
+    if stats:
+        summary_fields += COUNTERS + ("schedule_seconds",)
+    writer.writerow(("algorithm", "quantum") + RESULT_FIELDS if per_process else summary_fields)
+    for row, processes in batch:
+        if per_process:
+            for p in processes:
+                writer.writerow([row["algorithm"], row["quantum"]] + [getattr(p, field) for field in RESULT_FIELDS])
+        else:
+            # The per-priority maxima go into one column as a JSON object
+            writer.writerow([json.dumps(row[field]) if isinstance(row[field], dict) else row[field]
+                             for field in summary_fields])
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run CPU scheduling policies on a workload without the GUI.")
+    parser.add_argument("workload", help="CSV or JSONL workload (optionally .gz), or - for stdin")
+    parser.add_argument("-a", "--algorithm", action="append", choices=ALGORITHMS, dest="algorithms",
+                        help="policy to run (repeatable); default: every comparison run")
+    parser.add_argument("--all", action="store_true", help="run every comparison run (the default)")
+    parser.add_argument("-q", "--quantum", type=int, help="time quantum for round_robin")
+    parser.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    parser.add_argument("-f", "--format", choices=("csv", "json"),
+                        help="output format (default: from the output extension, else csv)")
+    parser.add_argument("--input-format", choices=("csv", "jsonl"), default="csv",
+                        help="format of a workload read from stdin (default: csv)")
+    parser.add_argument("--per-process", action="store_true", help="write each process's results, not only averages")
+    parser.add_argument("--stats", action="store_true",
+                        help="add the scheduler's counters (dispatches, preemptions, ...) and scheduling time")
+    parser.add_argument("--cores", type=int, default=1, help="simulated CPUs (default: 1)")
+    parser.add_argument("--queues", choices=QUEUE_MODES, default=QUEUE_GLOBAL,
+                        help="ready queues of a multi-core run: one shared queue or one per core (default: global)")
+    args = parser.parse_args(argv)
+    if args.cores < 1:
+        parser.error("--cores must be at least 1")
+    for method in args.algorithms or ():
+        if args.cores > 1 and method not in POLICY_ORDER:
+            parser.error(f"{method} can only be simulated on a single CPU")
+    if args.all:
+        args.algorithms = None
+    if args.algorithms and "round_robin" in args.algorithms and (args.quantum is None or args.quantum <= 0):
+        parser.error("round_robin needs a positive --quantum")
+    if args.format is None:
+        args.format = "json" if args.output.endswith(".json") else "csv"
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    try:
+        specs = read_workload(args.workload, args.input_format)
+    except (OSError, ValueError) as error:
+        print(f"error: {error}", file=sys.stderr)
+        return 2
+    if not specs:
+        print(f"error: {args.workload}: no processes", file=sys.stderr)
+        return 2
+    batch = run_batch(specs, selected_runs(args.algorithms, args.quantum, args.cores), args.stats, args.cores,
+                      args.queues)
+    smp = args.cores > 1
+    if args.output == "-":
+        try:
+            write_output(sys.stdout, args.format, batch, args.per_process, args.stats, smp)
+            sys.stdout.flush()
+        except BrokenPipeError:
+            # The reader (e.g. head) went away; silence the flush at interpreter exit
+            sys.stdout = open(os.devnull, "w")
+            return 1
+    else:
+        with open(args.output, "w", newline="") as file:
+            write_output(file, args.format, batch, args.per_process, args.stats, smp)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
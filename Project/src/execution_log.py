@@ -0,0 +1,115 @@
+# src/execution_log.py
+from array import array
+import numpy as np
+from process import color_for
+
+IDLE_PID = "I"  # Pid the schedulers log for idle gaps
+
+
+class ExecutionLog:
+    """Run-length Gantt log stored as parallel integer arrays.
+
+    A segment is (pid index, start, duration, queue length); pids, and the response time
+    of each pid, live once in side tables. Appending a segment that continues the previous
+    one of the same process extends it instead of adding a new one. Iterating yields the
+    same dicts the schedulers used to log (pid, start, duration, response_time,
+    queue_length), so code written against a list of dicts keeps working.
+    """
+
+    def __init__(self):
+        self.pids = []  # pid index -> pid
+        self._pid_index = {}  # pid -> pid index
+        self._response_times = []  # pid index -> response time (None for idle)
+        self._pid = array("i")
+        self._start = array("q")
+        self._duration = array("q")
+        self._queue_length = array("i")  # -1 when unknown
+
+    def intern(self, pid, response_time=None):
+        """Index of pid in the side tables, adding it if needed"""
+        index = self._pid_index.get(pid)
+        if index is None:
+            index = self._pid_index[pid] = len(self.pids)
+            self.pids.append(pid)
+            self._response_times.append(response_time)
+        elif response_time is not None:
+            self._response_times[index] = response_time
+        return index
+
+    def append(self, pid, start, duration, response_time=None, queue_length=None):
+        """Record a segment, merging it into the previous one if it directly continues it"""
+        index = self.intern(pid, response_time)
+        if self._pid and self._pid[-1] == index and self._start[-1] + self._duration[-1] == start:
+            self._duration[-1] += duration
+            return
+        self._pid.append(index)
+        self._start.append(start)
+        self._duration.append(duration)
+        self._queue_length.append(-1 if queue_length is None else queue_length)
+
+    def extend(self, pids, starts, durations, response_times, queue_lengths):
+        """Bulk-append segments given as arrays, e.g. a vectorized FCFS schedule (no merging)"""
+        if not isinstance(pids, np.ndarray):
+            pids = np.array(pids, dtype=object)  # Keep the pids' own types rather than coercing them
+        if not len(pids):
+            return
+        unique, inverse = np.unique(pids, return_inverse=True)
+        # Response times of the first row of each pid, written to the side table once per pid
+        first = np.full(len(unique), len(pids), dtype=np.int64)
+        np.minimum.at(first, inverse, np.arange(len(pids)))
+        response_times = np.asarray(response_times)
+        if not self.pids:
+            # Fresh log (the usual case): fill the side tables in one go
+            self.pids = unique.tolist()
+            self._pid_index = dict(zip(self.pids, range(len(self.pids))))
+            self._response_times = response_times[first].tolist()
+            indexes = np.arange(len(unique), dtype=np.int32)
+        else:
+            indexes = np.array([self.intern(pid, int(response_times[row]))
+                                for pid, row in zip(unique.tolist(), first.tolist())], dtype=np.int32)
+        self._pid.frombytes(indexes[inverse].astype(np.int32).tobytes())
+        self._start.frombytes(np.asarray(starts, dtype=np.int64).tobytes())
+        self._duration.frombytes(np.asarray(durations, dtype=np.int64).tobytes())
+        self._queue_length.frombytes(np.asarray(queue_lengths, dtype=np.int32).tobytes())
+
+    def segment(self, position):
+        """Segment at a position as a dict"""
+        index = self._pid[position]
+        queue_length = self._queue_length[position]
+        return {
+            "pid": self.pids[index],
+            "start": self._start[position],
+            "duration": self._duration[position],
+            "response_time": self._response_times[index],
+            "queue_length": None if queue_length < 0 else queue_length,
+        }
+
+    def columns(self):
+        """(pid index, start, duration) as NumPy arrays (copies, so the log can keep growing)"""
+        return (np.array(self._pid, dtype=np.int32), np.array(self._start, dtype=np.int64),
+                np.array(self._duration, dtype=np.int64))
+
+    def colors(self, idle_color="grey"):
+        """Display color of every pid in the log, worked out once per pid"""
+        return {pid: idle_color if pid == IDLE_PID else color_for(pid) for pid in self.pids}
+
+    def nbytes(self):
+        """Memory held by the segment arrays"""
+        return sum(column.itemsize * len(column)
+                   for column in (self._pid, self._start, self._duration, self._queue_length))
+
+    def __len__(self):
+        return len(self._pid)
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self.segment(i) for i in range(*position.indices(len(self)))]
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("ExecutionLog index out of range")
+        return self.segment(position)
+
+    def __iter__(self):
+        for position in range(len(self)):
+            yield self.segment(position)
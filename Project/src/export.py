@@ -0,0 +1,105 @@
+# src/export.py
+import os
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from PIL import Image
+from gantt import GanttRenderer
+
+STATIC_FORMATS = (".png", ".svg", ".pdf")
+ANIMATED_FORMATS = (".gif", ".mp4")
+
+# Animations with fewer frames than this are rendered in-process; worker start-up would cost more
+PARALLEL_FRAMES = 60
+
+
+def gantt_figure(execution_log, figsize=(10, 5), dpi=100):
+    """Off-screen Agg figure holding a Gantt chart of the log; never touches a display"""
+    figure = Figure(figsize=figsize, dpi=dpi)
+    FigureCanvasAgg(figure)
+    renderer = GanttRenderer(figure.add_subplot(), execution_log)
+    return figure, renderer
+
+
+def render_frames(job):
+    """Render one chunk of (frame number, time) pairs to PNG files in a directory.
+
+    Frames for a GIF are quantized to a palette here, in the worker, so stitching them is
+    little more than copying.
+    """
+    execution_log, frames, directory, figsize, dpi, palette = job
+    figure, renderer = gantt_figure(execution_log, figsize, dpi)
+    canvas, ax = figure.canvas, renderer.ax
+    clock = ax.text(0.99, 0.98, "", transform=ax.transAxes, ha="right", va="top")
+    # Axes, ticks and labels are the same in every frame: draw them once and only redraw
+    # the bars and the clock on top of the saved background
+    renderer.collection.set_animated(True)
+    clock.set_animated(True)
+    canvas.draw()
+    background = canvas.copy_from_bbox(figure.bbox)
+    for number, time in frames:
+        canvas.restore_region(background)
+        renderer.render(until=time)
+        clock.set_text(f"t = {time:g}")
+        ax.draw_artist(renderer.collection)
+        ax.draw_artist(clock)
+        image = Image.fromarray(np.asarray(canvas.buffer_rgba())).convert("RGB")
+        if palette:
+            image = image.convert("P", palette=Image.Palette.ADAPTIVE)
+        image.save(os.path.join(directory, f"frame_{number:06d}.png"), compress_level=1)
+    return len(frames)
+
+
+def export_gantt(execution_log, path, fps=10, max_frames=300, max_workers=None, figsize=(10, 5), dpi=100):
+    """Write a Scheduler.execution_log as a static chart (.png/.svg/.pdf) or an animation (.gif/.mp4).
+
+    A list of per-core logs (Scheduler.core_logs) is drawn with one row per core.
+
+    Animations show the schedule growing over max_frames evenly spaced time steps. Frames
+    are rendered off-screen with Agg in chunks spread over a ProcessPoolExecutor (from
+    PARALLEL_FRAMES frames on, or whenever max_workers is given; max_workers=1 renders
+    serially), then stitched with Pillow (GIF) or ffmpeg (MP4). Returns the path.
+    """
+    extension = os.path.splitext(str(path))[1].lower()
+    if extension in STATIC_FORMATS:
+        figure, _ = gantt_figure(execution_log, figsize, dpi)
+        figure.savefig(path)
+        return path
+    if extension not in ANIMATED_FORMATS:
+        raise ValueError(f"Unsupported export format: {path} (expected one of {STATIC_FORMATS + ANIMATED_FORMATS})")
+    if extension == ".mp4" and shutil.which("ffmpeg") is None:
+        raise RuntimeError("Exporting MP4 needs ffmpeg on the PATH")
+    logs = [log for log in (execution_log if isinstance(execution_log, list) else [execution_log]) if len(log)]
+    if not logs:
+        raise ValueError("Cannot animate an empty execution log")
+
+    end_time = max(float((starts + durations).max()) for _, starts, durations in (log.columns() for log in logs))
+    count = max(1, min(max_frames, int(np.ceil(end_time))))
+    frames = list(enumerate(np.linspace(end_time / count, end_time, count).tolist()))
+
+    with tempfile.TemporaryDirectory() as directory:
+        parallel = max_workers != 1 and (max_workers is not None or count >= PARALLEL_FRAMES)
+        workers = min(count, max_workers or os.cpu_count() or 1) if parallel else 1
+        jobs = [(execution_log, [frames[i] for i in chunk], directory, figsize, dpi, extension == ".gif")
+                for chunk in np.array_split(np.arange(count), workers) if len(chunk)]
+        if workers == 1:
+            for job in jobs:
+                render_frames(job)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(render_frames, jobs))
+
+        pattern = os.path.join(directory, "frame_%06d.png")
+        if extension == ".gif":
+            images = (Image.open(pattern % number) for number in range(count))
+            first = next(images)
+            first.save(path, save_all=True, append_images=images, duration=int(1000 / fps), loop=0,
+                       optimize=False)
+        else:
+            subprocess.run(["ffmpeg", "-y", "-loglevel", "error", "-framerate", str(fps), "-i", pattern,
+                            "-pix_fmt", "yuv420p", str(path)], check=True)
+    return path
@@ -0,0 +1,277 @@
+# src/gantt.py
+import numpy as np
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import to_rgba
+from matplotlib.ticker import FuncFormatter, MaxNLocator
+
+
+class GanttAnimation:
+    """Animated Gantt chart that creates every artist once and blits only what changes.
+
+    Each task gets a bar and three labels when the animation is built. A frame restores
+    the saved background, grows the bars of running tasks and blits the axes, so its cost
+    depends on how many tasks are running, not on how many have been drawn. A finished
+    task is drawn into the background once, and full redraws (e.g. on resize) refresh it.
+    """
+
+    def __init__(self, figure, ax, tasks, y_positions, time_step=0.4, interval=100):
+        self.figure = figure
+        self.ax = ax
+        self.canvas = figure.canvas
+        self.time_step = time_step  # Time step per frame
+        max_time = max(task["start"] + task["duration"] for task in tasks)
+        self.last_frame = int(max_time / time_step) - 1
+        self.frame = 0
+
+        self.ax.clear()  # Drop the artists of the previous run
+        self.ax.set_title("Dynamic Gantt Chart")
+        self.ax.set_xlabel("Time")
+        self.ax.set_ylabel("Processes")
+        self.ax.set_xlim(0, max_time + 1)  # Time axis range
+        self.ax.set_ylim(0, len(y_positions) + 1)  # Task range based on unique y positions
+
+        # One entry per task in start order, so a frame only looks at tasks that changed
+        self.tasks = []
+        for task in sorted(tasks, key=lambda t: t["start"]):
+            task_end = task["start"] + task["duration"]
+            y_pos = y_positions[task["pid"]]
+            bar = self.ax.barh(y_pos, 0, left=task["start"], color=task["color"], edgecolor="black")[0]
+            # Task name inside the bar, start label above it and end label below it
+            name = self.ax.text(task["start"], y_pos, task["pid"],
+                                va="center", ha="center", color="black", fontweight="bold")
+            start_label = self.ax.text(task["start"], y_pos + 0.7, f"S: {task['start']}",
+                                       va="top", ha="center", fontsize=10, color="black")
+            end_label = self.ax.text(task_end, y_pos - 0.7, f"E: {task_end}",
+                                     va="bottom", ha="center", fontsize=10, color="black")
+            for artist in (bar, name, start_label, end_label):
+                artist.set_visible(False)
+                artist.set_animated(True)  # Left out of full redraws until the task finishes
+            self.tasks.append((task["start"], task["duration"], bar, name, start_label, end_label))
+        self.next_task = 0  # First task that has not started yet
+        self.active = []  # Tasks started but not yet finished
+
+        self.background = None
+        self.draw_handler = self.canvas.mpl_connect("draw_event", self.on_draw)
+        self.event_source = self.canvas.new_timer(interval=interval)
+        self.event_source.add_callback(self.step)
+
+    def start(self):
+        self.canvas.draw()  # Full draw once; on_draw saves the background
+        self.event_source.start()
+
+    def stop(self):
+        self.event_source.stop()
+        self.canvas.mpl_disconnect(self.draw_handler)
+
+    def on_draw(self, event):
+        """After a full redraw, save it as the background and put the running tasks back on top"""
+        self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.draw_artists(self.running_artists())
+
+    def running_artists(self):
+        return [artist for entry in self.active for artist in entry[2:5]]
+
+    def draw_artists(self, artists):
+        for artist in artists:
+            self.ax.draw_artist(artist)
+
+    def advance(self):
+        """Move to the next frame; returns the tasks that finished in it"""
+        current_time = self.frame * self.time_step  # Current time
+
+        # Reveal tasks that have started by now
+        while self.next_task < len(self.tasks) and self.tasks[self.next_task][0] <= current_time:
+            entry = self.tasks[self.next_task]
+            for artist in entry[2:5]:
+                artist.set_visible(True)
+            self.active.append(entry)
+            self.next_task += 1
+
+        finished = []
+        still_active = []
+        for entry in self.active:
+            task_start, duration, bar, name, start_label, end_label = entry
+            progress = min(current_time - task_start, duration)  # Dynamic bar length
+            bar.set_width(progress)
+            name.set_x(task_start + progress / 2)
+            # Show the end label when the task is completed or on the last frame
+            if progress >= duration or self.frame == self.last_frame:
+                end_label.set_visible(True)
+                for artist in entry[2:]:
+                    artist.set_animated(False)  # Part of the background from now on
+                finished.append(entry)
+            else:
+                still_active.append(entry)
+        self.active = still_active
+        self.frame += 1
+        return finished
+
+    def step(self):
+        """Timer callback: draw one frame by blitting, or stop after the last one"""
+        if self.frame > self.last_frame:
+            self.stop()
+            return
+        finished = self.advance()
+        if self.background is None:
+            return
+        self.canvas.restore_region(self.background)
+        if finished:
+            # Bake the finished tasks into the background so later frames never redraw them
+            self.draw_artists(artist for entry in finished for artist in entry[2:])
+            self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.draw_artists(self.running_artists())
+        self.canvas.blit(self.ax.bbox)
+
+
+def row_positions(pids, idle_pid="I"):
+    """Gantt row of each pid: idle on row 0, processes from row 1 in pid order"""
+    positions = {idle_pid: 0} if idle_pid in pids else {}
+    for y_pos, pid in enumerate(sorted(pid for pid in pids if pid != idle_pid), start=1):
+        positions[pid] = y_pos
+    return positions
+
+
+def merge_segments(starts, ends, min_gap):
+    """Merge consecutive segments separated by less than min_gap; returns (starts, ends)"""
+    if len(starts) < 2:
+        return starts, ends
+    breaks = np.flatnonzero(starts[1:] - ends[:-1] >= min_gap)
+    firsts = np.concatenate(([0], breaks + 1))
+    lasts = np.concatenate((breaks, [len(starts) - 1]))
+    return starts[firsts], ends[lasts]
+
+
+def log_rows(execution_log, row_of):
+    """(y, starts, ends, color) of every pid in a log, placed on row_of(pid)"""
+    pid_index, starts, durations = execution_log.columns()
+    colors = execution_log.colors()
+    # Per-pid start and end arrays, in time order (the log is already time ordered)
+    order = np.argsort(pid_index, kind="stable")
+    bounds = np.searchsorted(pid_index[order], np.arange(len(execution_log.pids) + 1))
+    for index, pid in enumerate(execution_log.pids):
+        rows = order[bounds[index]:bounds[index + 1]]
+        row_starts = starts[rows]
+        yield row_of(pid), row_starts, row_starts + durations[rows], to_rgba(colors[pid])
+
+
+class GanttRenderer:
+    """Static level-of-detail Gantt chart for execution logs too large to animate.
+
+    Every row keeps its segments as sorted start/end arrays, and all rows are drawn as one
+    PolyCollection whose rectangles are rebuilt for the visible x-range only: segments
+    outside it are culled with a binary search, and segments closer together than a pixel
+    are merged, so a redraw costs at most a few rectangles per row and pixel column however
+    long the run. (One collection for the whole chart rather than one per row: with many
+    processes the per-artist draw overhead would otherwise dominate.) Scrolling zooms around the cursor and dragging pans; any change
+    of the x-limits (including the Matplotlib toolbar) re-renders the viewport.
+
+    Given a list of per-core logs (Scheduler.core_logs) it draws one row per core instead,
+    each segment colored by the process that ran.
+    """
+
+    def __init__(self, ax, execution_log, height=0.8):
+        self.ax = ax
+        self.canvas = ax.figure.canvas
+        self.height = height
+        self.ax.clear()  # Drop the artists of the previous run
+
+        # Rows are (y, starts, ends, color) in time order: one per pid, or with a list of
+        # per-core logs one per (core, pid) so each core's row shows every pid it ran
+        self.rows = []
+        if isinstance(execution_log, list):
+            labels = {core: f"CPU {core}" for core in range(len(execution_log))}
+            for core, log in enumerate(execution_log):
+                self.rows.extend(log_rows(log, lambda pid: core))
+        else:
+            positions = row_positions(execution_log.pids)
+            labels = {y_pos: str(pid) for pid, y_pos in positions.items()}
+            self.rows.extend(log_rows(execution_log, positions.get))
+        self.collection = PolyCollection([], edgecolors="none")
+        self.ax.add_collection(self.collection)
+
+        self.ax.set_title("Gantt Chart")
+        self.ax.set_xlabel("Time")
+        self.ax.set_ylabel("Cores" if isinstance(execution_log, list) else "Processes")
+        # Let Matplotlib pick a readable number of row ticks and label them
+        self.ax.yaxis.set_major_locator(MaxNLocator(nbins=20, integer=True))
+        self.ax.yaxis.set_major_formatter(FuncFormatter(lambda y, _: labels.get(int(y), "") if y == int(y) else ""))
+        # One row of margin around the rows actually used (pids start at row 1 without an idle row)
+        self.ax.set_ylim(min(labels, default=0) - 1, max(labels, default=0) + 1)
+        end = max((int(ends[-1]) for _, _, ends, _ in self.rows if len(ends)), default=1)
+        self.ax.set_xlim(0, end)
+
+        self.drag_start = None
+        self.handlers = [
+            self.ax.callbacks.connect("xlim_changed", self.on_xlim_changed),
+            self.canvas.mpl_connect("scroll_event", self.on_scroll),
+            self.canvas.mpl_connect("button_press_event", self.on_press),
+            self.canvas.mpl_connect("motion_notify_event", self.on_motion),
+            self.canvas.mpl_connect("button_release_event", self.on_release),
+        ]
+        self.render()
+
+    def render(self, until=None):
+        """Rebuild the rectangles of every row for the current x-range.
+
+        With `until`, the chart shows the schedule as it stood at that time (used for
+        animation frames). Call canvas.draw or draw_idle afterwards to show the result.
+        """
+        x_min, x_max = self.ax.get_xlim()
+        pixel = (x_max - x_min) / max(self.ax.bbox.width, 1)  # Time units per pixel
+        if until is not None:
+            x_max = min(x_max, until)
+        all_verts, all_colors = [], []
+        for y_pos, starts, ends, color in self.rows:
+            # Segments overlapping [x_min, x_max]; ends are increasing like starts
+            first = np.searchsorted(ends, x_min, side="right")
+            last = np.searchsorted(starts, x_max, side="left")
+            visible_ends = ends[first:last] if until is None else np.minimum(ends[first:last], until)
+            visible_starts, visible_ends = merge_segments(starts[first:last], visible_ends, pixel)
+            bottom, top = y_pos - self.height / 2, y_pos + self.height / 2
+            verts = np.empty((len(visible_starts), 4, 2))
+            verts[:, 0, 0] = verts[:, 1, 0] = visible_starts
+            verts[:, 2, 0] = verts[:, 3, 0] = np.maximum(visible_ends, visible_starts + pixel)  # At least a pixel wide
+            verts[:, (0, 3), 1] = bottom
+            verts[:, (1, 2), 1] = top
+            all_verts.append(verts)
+            all_colors.append(np.broadcast_to(color, (len(verts), 4)))
+        self.collection.set_verts(np.concatenate(all_verts) if all_verts else [])
+        self.collection.set_facecolors(np.concatenate(all_colors) if all_colors else [])
+
+    def on_xlim_changed(self, ax):
+        self.render()
+        self.canvas.draw_idle()
+
+    def segment_count(self):
+        """Rectangles currently drawn"""
+        return len(self.collection.get_paths())
+
+    def on_scroll(self, event):
+        """Zoom the time axis around the cursor"""
+        if event.inaxes is not self.ax or event.xdata is None:
+            return
+        scale = 0.8 if event.button == "up" else 1.25
+        x_min, x_max = self.ax.get_xlim()
+        self.ax.set_xlim(event.xdata - (event.xdata - x_min) * scale,
+                         event.xdata + (x_max - event.xdata) * scale)
+
+    def on_press(self, event):
+        toolbar = self.canvas.toolbar  # Drags in the toolbar's pan/zoom modes are its own
+        if event.inaxes is self.ax and event.button == 1 and not (toolbar and toolbar.mode):
+            self.drag_start = event.xdata
+
+    def on_motion(self, event):
+        """Pan the time axis while the left button is held"""
+        if self.drag_start is None or event.inaxes is not self.ax or event.xdata is None:
+            return
+        shift = self.drag_start - event.xdata
+        x_min, x_max = self.ax.get_xlim()
+        self.ax.set_xlim(x_min + shift, x_max + shift)
+
+    def on_release(self, event):
+        self.drag_start = None
+
+    def disconnect(self):
+        self.ax.callbacks.disconnect(self.handlers[0])
+        for handler in self.handlers[1:]:
+            self.canvas.mpl_disconnect(handler)
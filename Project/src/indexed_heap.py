@@ -0,0 +1,106 @@
+# src/indexed_heap.py
+
+
+class IndexedHeap:
+    """Binary min-heap of (key, item) pairs that knows where every item sits.
+
+    Items must be hashable and appear at most once. Besides push and pop, update changes
+    the key of a queued item (decrease-key or increase-key) and remove takes one out, both
+    in O(log n) instead of the O(n) search and re-heapify a plain heapq list would need.
+    Ties between equal keys are left to the keys themselves, e.g. (priority, order) tuples.
+    """
+    __slots__ = ("keys", "items", "positions")
+
+    def __init__(self):
+        self.keys = []
+        self.items = []
+        self.positions = {}  # item -> index in keys/items
+
+    def push(self, item, key):
+        if item in self.positions:
+            raise ValueError(f"{item!r} is already in the heap")
+        self.keys.append(key)
+        self.items.append(item)
+        self.positions[item] = len(self.items) - 1
+        self.sift_up(len(self.items) - 1)
+
+    def peek(self):
+        """(item, key) with the smallest key, without removing it"""
+        return self.items[0], self.keys[0]
+
+    def pop(self):
+        """Remove and return the (item, key) with the smallest key"""
+        item, key = self.items[0], self.keys[0]
+        self.remove_at(0)
+        return item, key
+
+    def key_of(self, item):
+        return self.keys[self.positions[item]]
+
+    def update(self, item, key):
+        """Give a queued item a new key and restore the heap order around it"""
+        index = self.positions[item]
+        old = self.keys[index]
+        self.keys[index] = key
+        if key < old:
+            self.sift_up(index)
+        else:
+            self.sift_down(index)
+
+    def remove(self, item):
+        """Take a queued item out of the heap; returns its key"""
+        index = self.positions[item]
+        key = self.keys[index]
+        self.remove_at(index)
+        return key
+
+    def remove_at(self, index):
+        last = len(self.items) - 1
+        del self.positions[self.items[index]]
+        if index != last:
+            # Move the last entry into the hole, then sift it whichever way it needs to go
+            self.keys[index] = self.keys[last]
+            self.items[index] = self.items[last]
+            self.positions[self.items[index]] = index
+        self.keys.pop()
+        self.items.pop()
+        if index < last:
+            self.sift_down(index)
+            self.sift_up(index)
+
+    def sift_up(self, index):
+        keys, items, positions = self.keys, self.items, self.positions
+        key, item = keys[index], items[index]
+        while index:
+            parent = (index - 1) >> 1
+            if not key < keys[parent]:
+                break
+            keys[index], items[index] = keys[parent], items[parent]
+            positions[items[index]] = index
+            index = parent
+        keys[index], items[index] = key, item
+        positions[item] = index
+
+    def sift_down(self, index):
+        keys, items, positions = self.keys, self.items, self.positions
+        size = len(keys)
+        key, item = keys[index], items[index]
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and keys[child + 1] < keys[child]:
+                child += 1
+            if not keys[child] < key:
+                break
+            keys[index], items[index] = keys[child], items[child]
+            positions[items[index]] = index
+            index = child
+        keys[index], items[index] = key, item
+        positions[item] = index
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, item):
+        return item in self.positions
@@ -0,0 +1,76 @@
+# src/instrumentation.py
+import json
+import logging
+from collections import namedtuple
+
+# Counters and phase timers of one Scheduler run. dispatches counts every time a process
+# is put on the CPU, preemptions every time a running process is sent back to the ready
+# queue, idle_steps every idle gap skipped, queue_operations every ready-queue push and
+# pop, and log_segments the Gantt segments kept. timers maps a phase ("sort", "schedule",
+# "record") to seconds.
+RunStats = namedtuple("RunStats", [
+    "algorithm", "processes", "dispatches", "preemptions", "idle_steps", "queue_operations",
+    "log_segments", "context_switches", "timers",
+])
+
+# RunStats fields that are plain counts, e.g. for table columns
+COUNTERS = ("dispatches", "preemptions", "idle_steps", "queue_operations", "log_segments")
+
+
+def stats_record(stats):
+    """RunStats as a flat dict, with each timer as a "<phase>_seconds" field"""
+    record = stats._asdict()
+    for phase, seconds in record.pop("timers").items():
+        record[f"{phase}_seconds"] = seconds
+    return record
+
+
+class MemorySink:
+    """Keeps every RunStats it receives in self.records"""
+
+    def __init__(self):
+        self.records = []
+
+    def emit(self, stats):
+        self.records.append(stats)
+
+    def clear(self):
+        self.records.clear()
+
+
+class JsonLinesSink:
+    """Writes each RunStats as one JSON object per line to a path or an open text file"""
+
+    def __init__(self, file):
+        self.owns_file = isinstance(file, str)
+        self.file = open(file, "a") if self.owns_file else file
+
+    def emit(self, stats):
+        self.file.write(json.dumps(stats_record(stats)) + "\n")
+
+    def close(self):
+        if self.owns_file:
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class LoggingSink:
+    """Sends each RunStats to a logger, with the counters also attached as record.stats"""
+
+    def __init__(self, logger=None, level=logging.INFO):
+        self.logger = logger or logging.getLogger("scheduler")
+        self.level = level
+
+    def emit(self, stats):
+        if self.logger.isEnabledFor(self.level):
+            record = stats_record(stats)
+            self.logger.log(self.level, "%s: %d processes, %d dispatches, %d preemptions, %d idle steps, "
+                            "%d queue operations, %d log segments, scheduled in %.6fs",
+                            stats.algorithm, stats.processes, stats.dispatches, stats.preemptions,
+                            stats.idle_steps, stats.queue_operations, stats.log_segments,
+                            stats.timers.get("schedule", 0.0), extra={"stats": record})
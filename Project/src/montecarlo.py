@@ -0,0 +1,89 @@
+# src/montecarlo.py
+import math
+import random
+from statistics import NormalDist
+from process import Process
+from runner import run_all
+from scheduler import COMPARISON_RUNS
+
+METRICS = ("avg_waiting_time", "avg_turnaround_time", "avg_response_time")
+
+
+class RunningStat:
+    """Online mean and variance (Welford), so samples never have to be kept"""
+    __slots__ = ("count", "mean", "_m2")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+    def half_width(self, z):
+        """Half-width of the normal-approximation confidence interval for the mean"""
+        if self.count < 2:
+            return math.inf
+        return z * math.sqrt(self._m2 / (self.count - 1) / self.count)
+
+
+def random_workload(num_processes, rng, max_arrival=10, max_burst=10, max_priority=5):
+    """Random processes drawn the same way as SchedulerGUI.generate_random_processes"""
+    return [
+        Process(f"P{i + 1}", rng.randint(0, max_arrival), rng.randint(1, max_burst), rng.randint(1, max_priority))
+        for i in range(num_processes)
+    ]
+
+
+def run_comparison(processes, runs=COMPARISON_RUNS):
+    """Run every algorithm on a fresh copy of the workload and return metric averages per run name"""
+    return {result.name: result._asdict() for result in run_all(processes, runs, max_workers=1)}
+
+
+def monte_carlo_comparison(num_processes=5, tolerance=0.02, relative=True, confidence=0.95,
+                           min_samples=30, max_samples=5000, seed=None, on_sample=None, **workload_options):
+    """Compare all algorithms over random workloads until every confidence interval is tight enough.
+
+    Each sample draws a workload with random_workload(num_processes, ...) and runs every
+    entry of COMPARISON_RUNS on it. Sampling stops once the confidence interval of every
+    metric for every algorithm has a half-width of at most `tolerance`, or after max_samples
+    workloads. With relative=True the tolerance is a fraction of the metric's mean (so it
+    scales with the workload size), otherwise it is in time units. Returns one dict per
+    algorithm with the metric means, their "<metric>_ci" half-widths, the number of samples
+    used and whether every interval met the tolerance ("converged"). on_sample is called
+    with the number of samples so far after each one; an exception it raises stops the run.
+    """
+    rng = random.Random(seed)
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    stats = {name: {metric: RunningStat() for metric in METRICS} for name, _, _ in COMPARISON_RUNS}
+
+    def within_tolerance(stat):
+        limit = tolerance * abs(stat.mean) if relative else tolerance
+        return stat.half_width(z) <= limit
+
+    samples = 0
+    converged = False
+    while samples < max_samples:
+        workload = random_workload(num_processes, rng, **workload_options)
+        for name, metrics in run_comparison(workload).items():
+            for metric in METRICS:
+                stats[name][metric].add(metrics[metric])
+        samples += 1
+        if on_sample is not None:
+            on_sample(samples)
+        converged = all(within_tolerance(stat) for per_run in stats.values() for stat in per_run.values())
+        if samples >= min_samples and converged:
+            break
+
+    results = []
+    for name, per_run in stats.items():
+        result = {"name": name, "samples": samples, "converged": converged}
+        for metric, stat in per_run.items():
+            result[metric] = stat.mean
+            result[f"{metric}_ci"] = stat.half_width(z)
+        results.append(result)
+    return results
@@ -1,23 +1,49 @@
 # src/process.py
-import random
+import zlib
+
+
+def color_for(key):
+    """Light display color derived from a pid or palette index, so it is stable across runs.
+
+    Schedulers only log pids; charts call this when they draw.
+    """
+    h = zlib.crc32(str(key).encode())
+    r = 180 + (h & 0xFF) % 76
+    g = 180 + ((h >> 8) & 0xFF) % 76
+    b = 180 + ((h >> 16) & 0xFF) % 76
+    return f'#{r:02x}{g:02x}{b:02x}'
+
+
 class Process:
+    # Slots keep large generated workloads small; the color is only worked out when a chart needs it
+    __slots__ = ("pid", "arrival_time", "burst_time", "remaining_time", "priority", "waiting_time",
+                 "turnaround_time", "completion_time", "start_time", "response_time", "_color")
+
     def __init__(self, pid, arrival_time, burst_time, priority):
         self.pid = pid
         self.arrival_time = arrival_time
         self.burst_time = burst_time
         self.remaining_time = burst_time
         self.priority = priority
-        self.color = self.generate_color() 
+        self._color = None
         self.waiting_time = 0
         self.turnaround_time = 0
         self.completion_time = 0
         self.start_time = -1  
         self.response_time = None
+
+    @property
+    def color(self):
+        if self._color is None:
+            self._color = color_for(self.pid)
+        return self._color
+
+    @color.setter
+    def color(self, value):
+        self._color = value
+
     def generate_color(self):
-        r = random.randint(180, 255)
-        g = random.randint(180, 255)
-        b = random.randint(180, 255)
-        return f'#{r:02x}{g:02x}{b:02x}'  
+        return color_for(self.pid)
 
     def __repr__(self):
         return (f"Process {self.pid}: Arrival={self.arrival_time}, Burst={self.burst_time}, "
@@ -0,0 +1,200 @@
+# src/process_table.py
+import numpy as np
+from process import Process, color_for
+
+
+class ProcessTable:
+    """A workload stored column-wise, one NumPy array per process attribute"""
+
+    # Per-run columns that reset_state() restores; start_time and response_time use -1 for "not yet"
+    STATE_COLUMNS = ("remaining_time", "start_time", "completion_time",
+                     "waiting_time", "turnaround_time", "response_time")
+
+    def __init__(self, pids, arrival_times, burst_times, priorities):
+        self.pid = np.asarray(pids)  # Compact fixed-width strings or integers
+        self.arrival_time = np.asarray(arrival_times, dtype=np.int64)
+        self.burst_time = np.asarray(burst_times, dtype=np.int64)
+        self.priority = np.asarray(priorities, dtype=np.int64)
+        if not (len(self.pid) == len(self.arrival_time) == len(self.burst_time) == len(self.priority)):
+            raise ValueError("All ProcessTable columns must have the same length")
+        self.reset_state()
+
+    @classmethod
+    def from_processes(cls, processes):
+        """Build a table from an iterable of Process objects"""
+        processes = list(processes)
+        return cls(
+            [p.pid for p in processes],
+            [p.arrival_time for p in processes],
+            [p.burst_time for p in processes],
+            [p.priority for p in processes],
+        )
+
+    def to_processes(self):
+        """Materialize the workload as a list of Process objects"""
+        return [Process(pid, int(arrival), int(burst), int(priority))
+                for pid, arrival, burst, priority
+                in zip(self.pid, self.arrival_time, self.burst_time, self.priority)]
+
+    def reset_state(self):
+        """Reset every process's metrics before running a new scheduling algorithm"""
+        n = len(self.pid)
+        self.remaining_time = self.burst_time.copy()
+        self.start_time = np.full(n, -1, dtype=np.int64)
+        self.completion_time = np.zeros(n, dtype=np.int64)
+        self.waiting_time = np.zeros(n, dtype=np.int64)
+        self.turnaround_time = np.zeros(n, dtype=np.int64)
+        self.response_time = np.full(n, -1, dtype=np.int64)
+
+    def sort(self, key=None):
+        """Reorder the rows in place, by arrival time or by key(view) like list.sort"""
+        if key is None:
+            order = np.argsort(self.arrival_time, kind="stable")
+        else:
+            order = np.array(sorted(range(len(self)), key=lambda i: key(self[i])), dtype=np.int64)
+        for column in ("pid", "arrival_time", "burst_time", "priority") + self.STATE_COLUMNS:
+            setattr(self, column, getattr(self, column)[order])
+
+    def color(self, index):
+        """Display color of a row, derived from its pid when a chart asks for it"""
+        return color_for(self.pid[index].item())
+
+    def __len__(self):
+        return len(self.pid)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ProcessTable index out of range")
+        return ProcessView(self, index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield ProcessView(self, index)
+
+    def avg_waiting_time(self):
+        return float(self.waiting_time.mean()) if len(self) else 0.0
+
+    def avg_turnaround_time(self):
+        return float(self.turnaround_time.mean()) if len(self) else 0.0
+
+    def avg_response_time(self):
+        """Average response time; processes that never started count as zero, like in the GUI"""
+        if not len(self):
+            return 0.0
+        started = self.response_time >= 0
+        return float(self.response_time[started].sum()) / len(self)
+
+    def metrics(self):
+        """Vectorized metric averages in the same shape Visualizer stores them"""
+        return {
+            "avg_waiting_time": self.avg_waiting_time(),
+            "avg_turnaround_time": self.avg_turnaround_time(),
+            "avg_response_time": self.avg_response_time(),
+        }
+
+    def max_waiting_time_by_priority(self):
+        """Longest waiting time of each priority class, vectorized with one sort"""
+        order = np.lexsort((self.waiting_time, self.priority))
+        priorities = self.priority[order]
+        last = np.flatnonzero(np.append(priorities[1:] != priorities[:-1], True)) if len(self) else []
+        return {int(priorities[i]): int(self.waiting_time[order[i]]) for i in last}
+
+
+def _column(name, optional=False):
+    """Property that reads and writes one row of a ProcessTable column"""
+    def getter(self):
+        value = int(getattr(self.table, name)[self.index])
+        return None if optional and value < 0 else value
+
+    def setter(self, value):
+        getattr(self.table, name)[self.index] = -1 if value is None else value
+
+    return property(getter, setter)
+
+
+class ProcessView:
+    """Thin Process-like view of one row of a ProcessTable, for the schedulers and the GUI"""
+    __slots__ = ("table", "index")
+
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+
+    @property
+    def pid(self):
+        return self.table.pid[self.index].item()
+
+    arrival_time = _column("arrival_time")
+    burst_time = _column("burst_time")
+    priority = _column("priority")
+    remaining_time = _column("remaining_time")
+    start_time = _column("start_time")
+    completion_time = _column("completion_time")
+    waiting_time = _column("waiting_time")
+    turnaround_time = _column("turnaround_time")
+    response_time = _column("response_time", optional=True)
+
+    @property
+    def color(self):
+        return self.table.color(self.index)
+
+    def __repr__(self):
+        return (f"Process {self.pid}: Arrival={self.arrival_time}, Burst={self.burst_time}, "
+                f"Priority={self.priority}")
+
+    def calculate_response_time(self):
+        if self.start_time is not None:
+            self.response_time = self.start_time - self.arrival_time
+
+    def reset_state(self):
+        """Reset the process metrics before running a new scheduling algorithm"""
+        for column in ProcessTable.STATE_COLUMNS:
+            getattr(self.table, column)[self.index] = -1
+        self.remaining_time = self.burst_time
+        self.completion_time = 0
+        self.turnaround_time = 0
+        self.waiting_time = 0
+
+
+def average_metrics(processes):
+    """Average waiting, turnaround and response time of a ProcessTable or a list of processes"""
+    if isinstance(processes, ProcessTable):
+        return processes.metrics()
+    count = len(processes)
+    if not count:
+        return {"avg_waiting_time": 0.0, "avg_turnaround_time": 0.0, "avg_response_time": 0.0}
+    return {
+        "avg_waiting_time": sum(p.waiting_time for p in processes) / count,
+        "avg_turnaround_time": sum(p.turnaround_time for p in processes) / count,
+        "avg_response_time": sum(p.response_time for p in processes if p.response_time is not None) / count,
+    }
+
+
+def starvation_metrics(processes):
+    """Longest waiting time overall and per priority class, of a ProcessTable or a list of processes.
+
+    Averages hide starvation: a policy can keep them low while a few low-priority
+    processes wait almost forever, which the per-class maxima show.
+    """
+    if isinstance(processes, ProcessTable):
+        by_priority = processes.max_waiting_time_by_priority()
+    else:
+        by_priority = {}
+        for p in processes:
+            by_priority[p.priority] = max(by_priority.get(p.priority, p.waiting_time), p.waiting_time)
+        by_priority = dict(sorted(by_priority.items()))
+    return {
+        "max_waiting_time": max(by_priority.values(), default=0),
+        "max_waiting_time_by_priority": by_priority,
+    }
+
+
+def reset_states(processes):
+    """Reset per-run metrics, in one vectorized pass for a ProcessTable"""
+    if isinstance(processes, ProcessTable):
+        processes.reset_state()
+    else:
+        for process in processes:
+            process.reset_state()
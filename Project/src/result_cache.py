@@ -0,0 +1,116 @@
+# src/result_cache.py
+import os
+import pickle
+from collections import OrderedDict, namedtuple
+from scheduler import Scheduler
+from smp import QUEUE_GLOBAL
+from workload import workload_fingerprint
+
+# Per-process outcome fields kept for a cached run
+RESULT_COLUMNS = ("start_time", "completion_time", "waiting_time", "turnaround_time", "response_time")
+
+# Everything the GUI shows for one run: per-pid results, the Gantt log, the switch count,
+# the run's instrumentation.RunStats and, for multi-core runs, the per-core logs and utilization
+SimulationResult = namedtuple("SimulationResult", [
+    "results", "execution_log", "context_switches", "stats", "core_logs", "utilization",
+], defaults=((), ()))
+
+
+class ResultCache:
+    """Bounded LRU cache of simulation results keyed by (fingerprint, algorithm, quantum).
+
+    With a directory, entries are also pickled there, so results survive restarts and an
+    in-memory miss can still be served from disk.
+    """
+
+    def __init__(self, maxsize=128, directory=None):
+        self.maxsize = maxsize
+        self.directory = directory
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def path(self, key):
+        fingerprint, algorithm, quantum = key
+        return os.path.join(self.directory, f"{fingerprint}-{algorithm}-{quantum}.pickle")
+
+    def get(self, key):
+        """Cached value for key, or None"""
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+        if self.directory is not None:
+            try:
+                with open(self.path(key), "rb") as file:
+                    value = pickle.load(file)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                pass
+            else:
+                self.hits += 1
+                self.remember(key, value)
+                return value
+        self.misses += 1
+        return None
+
+    def put(self, key, value):
+        self.remember(key, value)
+        if self.directory is not None:
+            # Write to a temporary file first so a crash never leaves a truncated entry
+            path = self.path(key)
+            with open(path + ".tmp", "wb") as file:
+                pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(path + ".tmp", path)
+
+    def remember(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
+
+
+def simulate(processes, method, quantum=None, cache=None, fingerprint=None, on_complete=None,
+             cores=1, queues=QUEUE_GLOBAL):
+    """Run one Scheduler policy on processes (or reuse a cached run) and return a SimulationResult.
+
+    Either way the processes end up with the run's per-process results filled in. Pass the
+    workload's fingerprint if it is already known (e.g. WorkloadSpec.fingerprint). on_complete
+    is handed to the Scheduler; an exception it raises aborts the run without caching it.
+    With more than one core the run is simulated on that many CPUs (see Scheduler.run_smp).
+    """
+    algorithm = method if cores == 1 else f"{method}-smp{cores}-{queues}"
+    key = (fingerprint or workload_fingerprint(processes), algorithm, quantum)
+    result = cache.get(key) if cache is not None else None
+    if result is None:
+        scheduler = Scheduler(processes, on_complete=on_complete, cores=cores, queues=queues)
+        if quantum is not None:
+            getattr(scheduler, method)(quantum)
+        else:
+            getattr(scheduler, method)()
+        result = SimulationResult(
+            results={p.pid: tuple(getattr(p, column) for column in RESULT_COLUMNS) for p in processes},
+            execution_log=scheduler.execution_log,
+            context_switches=scheduler.context_switches,
+            stats=scheduler.stats,
+            core_logs=scheduler.core_logs,
+            utilization=scheduler.utilization,
+        )
+        if cache is not None:
+            cache.put(key, result)
+    else:
+        if isinstance(processes, list):
+            # Same process order as after the original run (fcfs sorts its list in place)
+            order = {pid: index for index, pid in enumerate(result.results)}
+            processes.sort(key=lambda p: order[p.pid])
+        for process in processes:
+            for column, value in zip(RESULT_COLUMNS, result.results[process.pid]):
+                setattr(process, column, value)
+    return result
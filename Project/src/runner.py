@@ -0,0 +1,94 @@
+# src/runner.py
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from process import Process
+from process_table import ProcessTable, average_metrics, starvation_metrics
+from scheduler import RECORD_NONE, Scheduler, COMPARISON_RUNS
+from workload import WorkloadSpec, workload_fingerprint
+
+# Workloads smaller than this run in-process; worker start-up would cost more than the runs
+PARALLEL_THRESHOLD = 2000
+
+# Outcome of one algorithm run, small and immutable so it can cross process boundaries cheaply
+RunResult = namedtuple(
+    "RunResult",
+    ["name", "avg_waiting_time", "avg_turnaround_time", "avg_response_time", "context_switches",
+     "dispatches", "preemptions", "idle_steps", "max_waiting_time", "max_waiting_time_by_priority"],
+)
+
+
+def workload_snapshot(processes):
+    """Picklable copy of a workload's inputs: a ProcessTable, or (pid, arrival, burst, priority) tuples"""
+    if isinstance(processes, ProcessTable):
+        return ProcessTable(processes.pid, processes.arrival_time, processes.burst_time, processes.priority)
+    if isinstance(processes, WorkloadSpec):
+        return processes.specs  # Already immutable, nothing to copy
+    return tuple((p.pid, p.arrival_time, p.burst_time, p.priority) for p in processes)
+
+
+def run_job(job):
+    """Run one (name, method, quantum, snapshot) job on its own processes and Scheduler"""
+    name, method, quantum, snapshot = job
+    if isinstance(snapshot, ProcessTable):
+        processes = ProcessTable(snapshot.pid, snapshot.arrival_time, snapshot.burst_time, snapshot.priority)
+    else:
+        processes = [Process(*spec) for spec in snapshot]
+    scheduler = Scheduler(processes, recording=RECORD_NONE)  # Only the averages are reported
+    if quantum is not None:
+        getattr(scheduler, method)(quantum)
+    else:
+        getattr(scheduler, method)()
+    stats = scheduler.stats
+    return RunResult(name=name, context_switches=scheduler.context_switches, dispatches=stats.dispatches,
+                     preemptions=stats.preemptions, idle_steps=stats.idle_steps, **average_metrics(processes),
+                     **starvation_metrics(processes))
+
+
+def run_all(processes, runs=COMPARISON_RUNS, max_workers=None, cache=None, on_result=None):
+    """Run every (name, method, quantum) in runs as an independent job and return their RunResults.
+
+    Jobs are spread over a ProcessPoolExecutor when the workload has at least
+    PARALLEL_THRESHOLD processes or max_workers is given; max_workers=1 forces a serial run.
+    With a result_cache.ResultCache, runs already cached for this workload are not repeated.
+    on_result is called with each RunResult as it becomes available (cached ones first); an
+    exception it raises stops the comparison, keeping the runs finished so far in the cache.
+    """
+    snapshot = workload_snapshot(processes)
+    results = {}
+    if cache is not None:
+        fingerprint = workload_fingerprint(processes)
+        for name, method, quantum in runs:
+            cached = cache.get((fingerprint, method, quantum))
+            if cached is not None:
+                results[name] = cached._replace(name=name)
+                if on_result is not None:
+                    on_result(results[name])
+    jobs = [(name, method, quantum, snapshot) for name, method, quantum in runs if name not in results]
+    parallel = max_workers != 1 and (max_workers is not None or len(snapshot) >= PARALLEL_THRESHOLD)
+
+    def collect(fresh):
+        for (_, method, quantum, _), result in zip(jobs, fresh):
+            results[result.name] = result
+            if cache is not None:
+                cache.put((fingerprint, method, quantum), result)
+            if on_result is not None:
+                on_result(result)
+
+    if not parallel or not jobs:
+        collect(run_job(job) for job in jobs)
+    else:
+        workers = min(len(jobs), max_workers or os.cpu_count() or 1)
+        pool = ProcessPoolExecutor(max_workers=workers)
+        futures = [pool.submit(run_job, job) for job in jobs]
+        try:
+            collect(future.result() for future in futures)
+        except BaseException:
+            # E.g. on_result cancelled the comparison: drop the queued jobs rather than wait
+            # for them (a "with" block would), and let the running ones finish in the background
+            for future in futures:
+                future.cancel()
+            pool.shutdown(wait=False)
+            raise
+        pool.shutdown()
+    return [results[name] for name, _, _ in runs]
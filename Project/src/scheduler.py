@@ -1,161 +1,448 @@
+import heapq
+from collections import deque
+from time import perf_counter
+import numpy as np
+from execution_log import ExecutionLog, IDLE_PID
+from indexed_heap import IndexedHeap
+from instrumentation import RunStats
+from process_table import ProcessTable
+from smp import QUEUE_GLOBAL, SMPEngine
+
+
+def fcfs_schedule(arrival_times, burst_times):
+    """Closed-form FCFS schedule for jobs already sorted by arrival time.
+
+    A job starts at the later of its arrival and the previous completion, so
+    completion[i] = elapsed[i] + max(0, max over j <= i of (arrival[j] - elapsed[j - 1])),
+    where elapsed is the running total of burst times. Returns (start, completion,
+    queue_lengths) arrays; queue_lengths[i] counts the jobs that have arrived but not
+    finished when job i completes.
+    """
+    arrival = np.asarray(arrival_times, dtype=np.int64)
+    burst = np.asarray(burst_times, dtype=np.int64)
+    elapsed = np.cumsum(burst)
+    idle_shift = np.maximum(np.maximum.accumulate(arrival - (elapsed - burst)), 0)
+    completion = elapsed + idle_shift
+    start = completion - burst
+    queue_lengths = np.searchsorted(arrival, completion, side="right") - np.arange(1, len(arrival) + 1)
+    return start, completion, queue_lengths
+
+
+def idle_gaps(start, completion):
+    """Number of idle gaps in a schedule given as start and completion arrays in run order"""
+    if not len(start):
+        return 0
+    return int(start[0] > 0) + int(np.count_nonzero(start[1:] > completion[:-1]))
+
+
+# Recording levels: what a run keeps besides the per-process metrics and context_switches.
+# "full" records the Gantt execution_log plus the response_times and queue_lengths series,
+# "summary" only the series, "none" nothing, so memory stays flat however long the run.
+RECORD_NONE = "none"
+RECORD_SUMMARY = "summary"
+RECORD_FULL = "full"
+RECORDING_LEVELS = (RECORD_NONE, RECORD_SUMMARY, RECORD_FULL)
+
+# Runs compared by Visualizer.run_all_algorithms: (display name, Scheduler method, RR quantum)
+COMPARISON_RUNS = [
+    ("FCFS", "fcfs", None),
+    ("SJF-Non", "sjf_non_preemptive", None),
+    ("SJF-Pree", "sjf_preemptive", None),
+    ("Priority Scheduling", "priority_scheduling", None),
+    ("Priority-Pree", "priority_preemptive", None),
+    ("RR (Quantum 1)", "round_robin", 1),
+    ("RR (Quantum 2)", "round_robin", 2),
+    ("RR (Quantum 3)", "round_robin", 3),
+    ("MLFQ", "mlfq", None),
+]
+
+# Default multilevel feedback queue: the quantum of each level, highest priority first,
+# and how often every process is boosted back to the top level
+MLFQ_QUANTA = (2, 4, 8)
+MLFQ_BOOST_INTERVAL = 50
+
+# Default aging of preemptive priority scheduling: time units a process waits per priority
+# level it gains
+PRIORITY_AGING = 10
+
+
 class Scheduler:
-    def __init__(self, processes):
-        self.processes = processes
+    def __init__(self, processes, arrival_sorted=False, on_complete=None, recording=RECORD_FULL, sink=None,
+                 cores=1, queues=QUEUE_GLOBAL, balance_interval=10, work_stealing=True):
+        if recording not in RECORDING_LEVELS:
+            raise ValueError(f"Unknown recording level: {recording!r} (expected one of {RECORDING_LEVELS})")
+        if cores < 1:
+            raise ValueError(f"Need at least one core, got {cores}")
+        self.processes = processes  # A list of Process objects, a ProcessTable or an arrival-sorted stream
+        self.arrival_sorted = arrival_sorted  # Consume processes in the given order instead of sorting them
+        self.on_complete = on_complete  # Called with each process as soon as it completes
+        self.recording = recording  # How much of each run to keep besides the per-process metrics
+        self._record_series = recording != RECORD_NONE  # response_times and queue_lengths
+        self._record_log = recording == RECORD_FULL  # execution_log
         self.context_switches = 0  # Initialize context_switches as an instance variable
-        self.execution_log = []  # To store the logs for Gantt chart
+        self.execution_log = ExecutionLog()  # To store the logs for Gantt chart
         self.response_times = []  # To store response times for each process
         self.queue_lengths = []  # To store the queue length at each time slice
+        self.sink = sink  # Receives the RunStats of every run (see instrumentation); None to keep them here only
+        self.stats = None  # RunStats of the last run
+        # More than one core runs every policy on smp.SMPEngine (see run_smp)
+        self.cores = cores
+        self.queues = queues  # smp.QUEUE_GLOBAL or smp.QUEUE_PER_CORE
+        self.balance_interval = balance_interval
+        self.work_stealing = work_stealing
+        self.core_logs = []  # One execution log per core of a multi-core run
+        self.utilization = []  # Busy fraction of each core over a multi-core run
+
+    def reset_run(self):
+        """Start a run with empty logs so nothing carries over from a previous algorithm"""
+        self.context_switches = 0
+        self.execution_log = ExecutionLog()
+        self.response_times = []
+        self.queue_lengths = []
+        self.stats = None
+        self.core_logs = []
+        self.utilization = []
+
+    def finish_run(self, algorithm, processes, dispatches, preemptions, idle_steps, queue_operations, timers):
+        """Keep the counters of the run that just ended in self.stats and hand them to the sink"""
+        self.stats = RunStats(algorithm, processes, dispatches, preemptions, idle_steps, queue_operations,
+                              len(self.execution_log) + sum(len(log) for log in self.core_logs),
+                              self.context_switches, timers)
+        if self.sink is not None:
+            self.sink.emit(self.stats)
+
+    def arrival_stream(self, key=lambda p: p.arrival_time):
+        """Iterator over the processes in arrival order; pre-sorted streams are read lazily"""
+        if self.arrival_sorted:
+            return iter(self.processes)
+        return iter(sorted(self.processes, key=key))
+
+    def run_smp(self, method, quantum=None):
+        """Run a policy on self.cores CPUs with smp.SMPEngine.
+
+        Each core's Gantt segments go to self.core_logs (execution_log stays empty) and its
+        busy fraction to self.utilization. context_switches counts preemptions, and
+        response_times are recorded in completion order; queue_lengths are not recorded.
+        """
+        self.reset_run()
+        started = perf_counter()
+        if method == "priority_scheduling":
+            arrivals = self.arrival_stream(key=lambda p: (p.arrival_time, p.priority))
+        else:
+            arrivals = self.arrival_stream()
+        sorted_at = perf_counter()
+        on_complete = self.on_complete
+        if self._record_series:
+            def on_complete(process, notify=self.on_complete):
+                self.response_times.append(process.response_time)
+                if notify is not None:
+                    notify(process)
+        engine = SMPEngine(self.cores, method, quantum, self.queues, self.balance_interval, self.work_stealing,
+                           record_log=self._record_log, on_complete=on_complete).run(arrivals)
+        scheduled_at = perf_counter()
+        if self._record_log:
+            self.core_logs = engine.core_logs
+        self.utilization = engine.utilization
+        self.context_switches = engine.preemptions
+        self.finish_run(method, engine.completed, engine.dispatches, engine.preemptions, engine.idle_steps,
+                        engine.queue_operations, {
+                            "sort": sorted_at - started, "schedule": scheduled_at - sorted_at})
 
     def fcfs(self):
         """First-Come-First-Serve (FCFS) Scheduling"""
-        print("First-Come-First-Serve (FCFS) Scheduling...")
-        self.processes.sort(key=lambda p: p.arrival_time)
+        if self.cores > 1:
+            self.run_smp("fcfs")
+            return
+        self.reset_run()
+        started = perf_counter()
+        if isinstance(self.processes, ProcessTable):
+            table = self.processes
+            table.sort()  # By arrival time
+            sorted_at = perf_counter()
+            start, completion, queue_lengths = fcfs_schedule(table.arrival_time, table.burst_time)
+            table.start_time = start
+            table.completion_time = completion
+            table.waiting_time = start - table.arrival_time
+            table.response_time = table.waiting_time.copy()
+            table.turnaround_time = completion - table.arrival_time
+            scheduled_at = perf_counter()
+            # Record the series and the Gantt segments straight from the arrays
+            if self._record_series:
+                self.response_times = table.response_time.tolist()
+                self.queue_lengths = queue_lengths.tolist()
+            if self._record_log:
+                self.execution_log.extend(table.pid, start, table.burst_time, table.response_time, queue_lengths)
+            if self.on_complete is not None:
+                for process in table:
+                    self.on_complete(process)
+            # Closed form: one dispatch per process and no ready queue at all
+            self.finish_run("fcfs", len(table), len(table), 0, idle_gaps(start, completion), 0, {
+                "sort": sorted_at - started, "schedule": scheduled_at - sorted_at,
+                "record": perf_counter() - scheduled_at})
+            return
+        if isinstance(self.processes, list):
+            self.processes.sort(key=lambda p: p.arrival_time)
+            processes = self.processes
+            sorted_at = perf_counter()
+            start, completion, queue_lengths = fcfs_schedule(
+                [p.arrival_time for p in processes], [p.burst_time for p in processes])
+            for process, start_time, completion_time in zip(processes, start.tolist(), completion.tolist()):
+                process.start_time = start_time
+                process.response_time = start_time - process.arrival_time  # Calculate response time
+                process.waiting_time = start_time - process.arrival_time
+                process.completion_time = completion_time
+                process.turnaround_time = completion_time - process.arrival_time
+        else:
+            # Any other iterable is treated as a stream and never materialized
+            self.fcfs_stream()
+            return
+
+        scheduled_at = perf_counter()
+        if self._record_series:  # Always on when the log is
+            response_times = start - np.array([p.arrival_time for p in processes], dtype=np.int64)
+            self.response_times = response_times.tolist()
+            self.queue_lengths = queue_lengths.tolist()
+        if self._record_log:
+            # Record the process executions for the Gantt chart; queue lengths are the
+            # processes still waiting when each one completes
+            self.execution_log.extend([p.pid for p in processes], start, completion - start,
+                                      response_times, queue_lengths)
+        if self.on_complete is not None:
+            for process in processes:
+                self.on_complete(process)
+        self.finish_run("fcfs", len(processes), len(processes), 0, idle_gaps(start, completion), 0, {
+            "sort": sorted_at - started, "schedule": scheduled_at - sorted_at,
+            "record": perf_counter() - scheduled_at})
+
+    def fcfs_stream(self):
+        """FCFS over an arrival stream, holding only processes that have arrived and not finished"""
+        started = perf_counter()
+        arrivals = self.arrival_stream()
+        next_arrival = next(arrivals, None)
+        sorted_at = perf_counter()
+        ready_queue = deque()
         current_time = 0
-        for process in self.processes:
-            if current_time < process.arrival_time:
-                current_time = process.arrival_time
+        dispatches = 0
+        idle_steps = 0
+
+        while ready_queue or next_arrival is not None:
+            if not ready_queue and next_arrival.arrival_time > current_time:
+                # CPU is idle, jump straight to the next arrival
+                idle_steps += 1
+                current_time = next_arrival.arrival_time
+            while next_arrival is not None and next_arrival.arrival_time <= current_time:
+                ready_queue.append(next_arrival)
+                next_arrival = next(arrivals, None)
+
+            process = ready_queue.popleft()
+            dispatches += 1
             process.start_time = current_time
             process.response_time = process.start_time - process.arrival_time  # Calculate response time
-            self.response_times.append(process.response_time)  # Add to response_times
             process.waiting_time = current_time - process.arrival_time
             current_time += process.burst_time
             process.completion_time = current_time
             process.turnaround_time = process.completion_time - process.arrival_time
 
-            # Record the process execution for the Gantt chart
-            self.execution_log.append({
-                "pid": process.pid,
-                "start": process.start_time,
-                "duration": process.burst_time,
-                "color": process.color,
-                "response_time": process.response_time,  
-                "queue_length": sum(1 for p in self.processes if p.arrival_time <= current_time and p.completion_time is None)
-            })
+            # Admit everything that arrived while the process ran, so the queue length is
+            # the number of processes still waiting when this one completes
+            while next_arrival is not None and next_arrival.arrival_time <= current_time:
+                ready_queue.append(next_arrival)
+                next_arrival = next(arrivals, None)
+
+            if self._record_series:
+                self.response_times.append(process.response_time)
+                self.queue_lengths.append(len(ready_queue))
+            if self._record_log:
+                self.execution_log.append(process.pid, process.start_time, process.burst_time,
+                                          process.response_time, len(ready_queue))
+            if self.on_complete is not None:
+                self.on_complete(process)
+        # Every process is pushed onto and popped off the ready queue once
+        self.finish_run("fcfs", dispatches, dispatches, 0, idle_steps, 2 * dispatches, {
+            "sort": sorted_at - started, "schedule": perf_counter() - sorted_at})
 
     def sjf_non_preemptive(self):
         """Shortest Job First (Non-preemptive) Scheduling"""
-        print("Running SJF (Non-preemptive) Scheduling...")
+        if self.cores > 1:
+            self.run_smp("sjf_non_preemptive")
+            return
+        self.reset_run()
         current_time = 0
-        remaining_processes = sorted(self.processes, key=lambda p: p.arrival_time)
-
-        while remaining_processes:
-            available_processes = [p for p in remaining_processes if p.arrival_time <= current_time]
+        started = perf_counter()
+        arrivals = self.arrival_stream()
+        next_arrival = next(arrivals, None)
+        sorted_at = perf_counter()
+        ready_heap = []  # (burst_time, arrival_order, process)
+        arrival_order = 0
+        idle_steps = 0
+
+        while ready_heap or next_arrival is not None:
+            # Admit every process that has arrived by now
+            while next_arrival is not None and next_arrival.arrival_time <= current_time:
+                heapq.heappush(ready_heap, (next_arrival.burst_time, arrival_order, next_arrival))
+                arrival_order += 1
+                next_arrival = next(arrivals, None)
 
             # Record the queue length
-            self.queue_lengths.append(len(available_processes))
+            if self._record_series:
+                self.queue_lengths.append(len(ready_heap))
 
-            if available_processes:
+            if ready_heap:
+                queue_length = len(ready_heap)
                 # Select the process with the shortest burst time
-                shortest_process = min(available_processes, key=lambda p: p.burst_time)
-
-                if current_time < shortest_process.arrival_time:
-                    current_time = shortest_process.arrival_time
+                _, _, shortest_process = heapq.heappop(ready_heap)
 
                 if shortest_process.start_time == -1:  # This means the process hasn't started yet
                     shortest_process.start_time = current_time
                     shortest_process.response_time = shortest_process.start_time - shortest_process.arrival_time  # Calculate response time
-                    self.response_times.append(shortest_process.response_time)  # Add to response_times
-                    # print(f"Process {shortest_process.pid} started at {shortest_process.start_time}")
+                    if self._record_series:
+                        self.response_times.append(shortest_process.response_time)  # Add to response_times
 
                 shortest_process.waiting_time = current_time - shortest_process.arrival_time
                 current_time += shortest_process.burst_time
                 shortest_process.completion_time = current_time
                 shortest_process.turnaround_time = shortest_process.completion_time - shortest_process.arrival_time
-                
+                if self.on_complete is not None:
+                    self.on_complete(shortest_process)
+
                 # Record the process execution for the Gantt chart
-                self.execution_log.append({
-                    "pid": shortest_process.pid,
-                    "start": shortest_process.start_time,
-                    "duration": shortest_process.burst_time,
-                    "color": shortest_process.color,
-                    "response_time": shortest_process.response_time, 
-                    "queue_length": len(available_processes) 
-                })
-
-                remaining_processes.remove(shortest_process)
+                if self._record_log:
+                    self.execution_log.append(shortest_process.pid, shortest_process.start_time, shortest_process.burst_time,
+                                              shortest_process.response_time, queue_length)
             else:
-                current_time += 1  # Increment time if no processes are available yet
+                # Fast-forward to the next arrival if no processes are available yet
+                idle_steps += 1
+                current_time = max(current_time, next_arrival.arrival_time)
+        # Every process is pushed, popped and dispatched exactly once
+        self.finish_run("sjf_non_preemptive", arrival_order, arrival_order, 0, idle_steps, 2 * arrival_order, {
+            "sort": sorted_at - started, "schedule": perf_counter() - sorted_at})
 
     def sjf_preemptive(self):
-        """Shortest Job First (Preemptive) Scheduling"""
-        print("Running SJF (Preemptive) Scheduling...")
+        """Shortest Job First (Preemptive) Scheduling, driven by arrival and completion events"""
+        if self.cores > 1:
+            self.run_smp("sjf_preemptive")
+            return
+        self.reset_run()
+        started = perf_counter()
+        arrivals = self.arrival_stream()
+        next_arrival = next(arrivals, None)
+        sorted_at = perf_counter()
+        # Heap entries are (remaining_time, tie_breaker, process). Arrivals get increasing
+        # tie breakers and preempted processes decreasing ones, so ties resolve the same way
+        # as a stable sort of the ready queue: a preempted process goes ahead of everything
+        # already waiting with the same remaining time, new arrivals go behind it.
+        ready_heap = []
+        arrival_order = 0
+        preempt_order = 0
         current_time = 0
-        remaining_processes = sorted(self.processes, key=lambda p: p.arrival_time)
-        ready_queue = []
-        last_process = None  # Track the last executed process
-
-        while remaining_processes or ready_queue:
-            # Move processes from remaining_processes to ready_queue as time passes
-            while remaining_processes and remaining_processes[0].arrival_time <= current_time:
-                ready_queue.append(remaining_processes.pop(0))
-
-            # Record the queue length
-            self.queue_lengths.append(len(ready_queue))
-
-            if ready_queue:
-                # Sort ready_queue by remaining burst time
-                ready_queue.sort(key=lambda p: p.remaining_time)
-                # Pick the process with the shortest remaining burst time
-                shortest_process = ready_queue[0]
-
-                if shortest_process.start_time == -1:  # This means the process hasn't started yet
-                    shortest_process.start_time = current_time
-                    shortest_process.response_time = shortest_process.start_time - shortest_process.arrival_time  # Calculate response time
-                    self.response_times.append(shortest_process.response_time)  # Add to response_times
-                    if last_process != shortest_process:  # If it's a different process, increment context switch
-                        self.context_switches += 1
-                    # print(f"Process {shortest_process.pid} started at {shortest_process.start_time}")
-
-                # Execute process for 1 time unit
-                start_time = current_time
-                shortest_process.remaining_time -= 1
-                current_time += 1
-
-                # Record the process execution for the Gantt chart
-                self.execution_log.append({
-                    "pid": shortest_process.pid,
-                    "start": start_time,
-                    "duration": 1,  # 1 time unit per step in preemptive SJF
-                    "color": shortest_process.color,
-                    "response_time": shortest_process.response_time, 
-                    "queue_length": len(ready_queue)  
-                })
-
-                if shortest_process.remaining_time == 0:
-                    shortest_process.completion_time = current_time
-                    shortest_process.turnaround_time = shortest_process.completion_time - shortest_process.arrival_time
-                    shortest_process.waiting_time = shortest_process.turnaround_time - shortest_process.burst_time
-                    ready_queue.remove(shortest_process)  # Process is completed and removed from queue
-
-                # Update the last executed process
-                last_process = shortest_process
-            else:
-                current_time += 1  # Increment time if no processes are ready
+        running = None  # Process currently on the CPU
+        segment_start = 0  # Start of the running process's current uninterrupted run
+        segment_queue_length = 0
+        dispatches = 0
+        idle_steps = 0
+
+        while True:
+            # Admit every process that has arrived by now
+            while next_arrival is not None and next_arrival.arrival_time <= current_time:
+                heapq.heappush(ready_heap, (next_arrival.remaining_time, arrival_order, next_arrival))
+                arrival_order += 1
+                next_arrival = next(arrivals, None)
+
+            # Record the queue length (ready processes plus the running one)
+            if self._record_series:
+                self.queue_lengths.append(len(ready_heap) + (running is not None))
+
+            # Preempt the running process only if a strictly shorter job is ready
+            if running is not None and ready_heap and ready_heap[0][0] < running.remaining_time:
+                if self._record_log:
+                    self.execution_log.append(running.pid, segment_start, current_time - segment_start,
+                                              running.response_time, segment_queue_length)
+                preempt_order -= 1
+                heapq.heappush(ready_heap, (running.remaining_time, preempt_order, running))
+                running = None
+
+            if running is None:
+                if not ready_heap:
+                    if next_arrival is None:
+                        break
+                    # CPU is idle, jump straight to the next arrival
+                    idle_steps += 1
+                    current_time = max(current_time, next_arrival.arrival_time)
+                    continue
+
+                # Dispatch the process with the shortest remaining time
+                _, _, running = heapq.heappop(ready_heap)
+                dispatches += 1
+                segment_start = current_time
+                segment_queue_length = len(ready_heap) + 1
+                if running.start_time == -1:  # This means the process hasn't started yet
+                    running.start_time = current_time
+                    running.response_time = running.start_time - running.arrival_time  # Calculate response time
+                    if self._record_series:
+                        self.response_times.append(running.response_time)  # Add to response_times
+                    self.context_switches += 1
+
+            # Run until the process completes or the next arrival, whichever comes first
+            run_until = current_time + running.remaining_time
+            if next_arrival is not None and next_arrival.arrival_time < run_until:
+                run_until = next_arrival.arrival_time
+            running.remaining_time -= run_until - current_time
+            current_time = run_until
+
+            if running.remaining_time <= 0:
+                # Record the whole uninterrupted run as one segment for the Gantt chart
+                if self._record_log:
+                    self.execution_log.append(running.pid, segment_start, current_time - segment_start,
+                                              running.response_time, segment_queue_length)
+                running.completion_time = current_time
+                running.turnaround_time = running.completion_time - running.arrival_time
+                running.waiting_time = running.turnaround_time - running.burst_time
+                if self.on_complete is not None:
+                    self.on_complete(running)
+                running = None
+        # Preempted processes go back on the heap (preempt_order counts down once per preemption)
+        preemptions = -preempt_order
+        self.finish_run("sjf_preemptive", arrival_order, dispatches, preemptions, idle_steps,
+                        arrival_order + preemptions + dispatches, {
+                            "sort": sorted_at - started, "schedule": perf_counter() - sorted_at})
 
     def priority_scheduling(self):
         """Priority Scheduling (Non-preemptive)"""
-        print("Priority Scheduling (Non-preemptive)...")
+        if self.cores > 1:
+            self.run_smp("priority_scheduling")
+            return
+        self.reset_run()
         current_time = 0
-        remaining_processes = sorted(self.processes, key=lambda p: (p.arrival_time, p.priority))
-
-        while remaining_processes:
-            # Find processes that have arrived and sort by priority
-            available_processes = [p for p in remaining_processes if p.arrival_time <= current_time]
+        started = perf_counter()
+        arrivals = self.arrival_stream(key=lambda p: (p.arrival_time, p.priority))
+        next_arrival = next(arrivals, None)
+        sorted_at = perf_counter()
+        ready_heap = []  # (priority, arrival_order, process)
+        arrival_order = 0
+        idle_steps = 0
+
+        while ready_heap or next_arrival is not None:
+            # Admit every process that has arrived by now
+            while next_arrival is not None and next_arrival.arrival_time <= current_time:
+                heapq.heappush(ready_heap, (next_arrival.priority, arrival_order, next_arrival))
+                arrival_order += 1
+                next_arrival = next(arrivals, None)
 
             # Record the queue length
-            self.queue_lengths.append(len(available_processes))
+            if self._record_series:
+                self.queue_lengths.append(len(ready_heap))
 
-            if available_processes:
+            if ready_heap:
+                queue_length = len(ready_heap)
                 # Choose the process with the highest priority (lowest priority number)
-                highest_priority_process = min(available_processes, key=lambda p: p.priority)
-                if current_time < highest_priority_process.arrival_time:
-                    current_time = highest_priority_process.arrival_time
+                _, _, highest_priority_process = heapq.heappop(ready_heap)
 
                 # Set start time if not already set
                 if highest_priority_process.start_time == -1:
                     highest_priority_process.start_time = current_time
                     highest_priority_process.response_time = highest_priority_process.start_time - highest_priority_process.arrival_time
-                    self.response_times.append(highest_priority_process.response_time)
+                    if self._record_series:
+                        self.response_times.append(highest_priority_process.response_time)
 
                 # Update waiting time
                 highest_priority_process.waiting_time = current_time - highest_priority_process.arrival_time
@@ -164,97 +451,398 @@ class Scheduler:
                 current_time += highest_priority_process.burst_time
                 highest_priority_process.completion_time = current_time
                 highest_priority_process.turnaround_time = highest_priority_process.completion_time - highest_priority_process.arrival_time
+                if self.on_complete is not None:
+                    self.on_complete(highest_priority_process)
 
                 # Record the process execution for the Gantt chart
-                self.execution_log.append({
-                    "pid": highest_priority_process.pid,
-                    "start": highest_priority_process.start_time,
-                    "duration": highest_priority_process.burst_time,
-                    "color": highest_priority_process.color,
-                    "response_time": highest_priority_process.response_time, 
-                    "queue_length": len(available_processes)  
-                })
-
-                remaining_processes.remove(highest_priority_process)
+                if self._record_log:
+                    self.execution_log.append(highest_priority_process.pid, highest_priority_process.start_time,
+                                              highest_priority_process.burst_time,
+                                              highest_priority_process.response_time, queue_length)
             else:
-                # Increment time if no processes are available yet
-                self.execution_log.append({
-                    "pid": "I",  # Idle
-                    "start": current_time,
-                    "duration": 1,
-                    "color": "#D3D3D3",  # Idle color
-                    "response_time": None,  # Idle has no response time
-                    "queue_length": len(remaining_processes)  # Remaining processes count
-                })
-                current_time += 1
-
+                # Fast-forward to the next arrival, logging the gap as a single idle slice
+                idle_until = max(current_time, next_arrival.arrival_time)
+                if self._record_log:
+                    # Idle has no response time, and nothing is ready while the CPU idles
+                    self.execution_log.append(IDLE_PID, current_time, idle_until - current_time, None, len(ready_heap))
+                idle_steps += 1
+                current_time = idle_until
+        # Every process is pushed, popped and dispatched exactly once
+        self.finish_run("priority_scheduling", arrival_order, arrival_order, 0, idle_steps, 2 * arrival_order, {
+            "sort": sorted_at - started, "schedule": perf_counter() - sorted_at})
+
+    def priority_preemptive(self, aging=PRIORITY_AGING):
+        """Priority Scheduling (Preemptive) with aging, driven by arrival, completion and aging events.
+
+        A ready process with a strictly higher priority (lower number) than the running one
+        preempts it. For every `aging` time units a process waits without running, its
+        priority number drops by one, down to 0; it keeps the aged priority until it
+        completes (None or 0 disables aging). The ready queue and the pending aging steps
+        are IndexedHeaps, so an aging step is a decrease-key and every event costs
+        O(log n) rather than a rescan of the waiting processes.
+        """
+        if self.cores > 1:
+            raise ValueError("Preemptive priority scheduling is only simulated on a single CPU")
+        self.reset_run()
+        started = perf_counter()
+        arrivals = self.arrival_stream(key=lambda p: (p.arrival_time, p.priority))
+        next_arrival = next(arrivals, None)
+        sorted_at = perf_counter()
+        # Ready entries are keyed (priority, tie breaker): arrivals get increasing tie breakers
+        # and preempted processes decreasing ones, so a preempted process goes ahead of every
+        # waiting process with the same priority, as in sjf_preemptive
+        ready = IndexedHeap()
+        aging_due = IndexedHeap()  # Waiting process -> time of its next aging step
+        effective = {}  # Current (aged) priority of every admitted, unfinished process
+        admitted = 0
+        preempt_order = 0
+        current_time = 0
+        running = None
+        segment_start = 0
+        segment_queue_length = 0
+        dispatches = 0
+        aging_steps = 0
+        idle_steps = 0
+
+        while True:
+            # Admit every process that has arrived by now
+            while next_arrival is not None and next_arrival.arrival_time <= current_time:
+                effective[next_arrival] = next_arrival.priority
+                ready.push(next_arrival, (next_arrival.priority, admitted))
+                if aging and next_arrival.priority > 0:
+                    aging_due.push(next_arrival, next_arrival.arrival_time + aging)
+                admitted += 1
+                next_arrival = next(arrivals, None)
+
+            # Age every process whose wait just reached its next step
+            while aging_due and aging_due.peek()[1] <= current_time:
+                process, due = aging_due.peek()
+                effective[process] -= 1
+                ready.update(process, (effective[process], ready.key_of(process)[1]))
+                if effective[process] > 0:
+                    aging_due.update(process, due + aging)
+                else:
+                    aging_due.remove(process)
+                aging_steps += 1
+
+            # Record the queue length (ready processes plus the running one)
+            if self._record_series:
+                self.queue_lengths.append(len(ready) + (running is not None))
+
+            # Preempt the running process only if a strictly higher priority one is ready
+            if running is not None and ready and ready.peek()[1][0] < effective[running]:
+                if self._record_log:
+                    self.execution_log.append(running.pid, segment_start, current_time - segment_start,
+                                              running.response_time, segment_queue_length)
+                preempt_order -= 1
+                ready.push(running, (effective[running], preempt_order))
+                if aging and effective[running] > 0:
+                    aging_due.push(running, current_time + aging)
+                running = None
+
+            if running is None:
+                if not ready:
+                    if next_arrival is None:
+                        break
+                    # Fast-forward to the next arrival, logging the gap as a single idle slice
+                    idle_until = max(current_time, next_arrival.arrival_time)
+                    if self._record_log:
+                        self.execution_log.append(IDLE_PID, current_time, idle_until - current_time, None, 0)
+                    idle_steps += 1
+                    current_time = idle_until
+                    continue
+
+                # Dispatch the process with the highest (aged) priority; it stops aging
+                running, _ = ready.pop()
+                if running in aging_due:
+                    aging_due.remove(running)
+                dispatches += 1
+                segment_start = current_time
+                segment_queue_length = len(ready) + 1
+                if running.start_time == -1:
+                    running.start_time = current_time
+                    running.response_time = running.start_time - running.arrival_time
+                    if self._record_series:
+                        self.response_times.append(running.response_time)
+
+            # Run until the process completes, the next arrival or the next aging step
+            run_until = current_time + running.remaining_time
+            if next_arrival is not None and next_arrival.arrival_time < run_until:
+                run_until = next_arrival.arrival_time
+            if aging_due and aging_due.peek()[1] < run_until:
+                run_until = aging_due.peek()[1]
+            running.remaining_time -= run_until - current_time
+            current_time = run_until
+
+            if running.remaining_time <= 0:
+                if self._record_log:
+                    self.execution_log.append(running.pid, segment_start, current_time - segment_start,
+                                              running.response_time, segment_queue_length)
+                running.completion_time = current_time
+                running.turnaround_time = running.completion_time - running.arrival_time
+                running.waiting_time = running.turnaround_time - running.burst_time
+                if self.on_complete is not None:
+                    self.on_complete(running)
+                del effective[running]
+                running = None
+        # Preempted processes go back on the ready heap (preempt_order counts down once per
+        # preemption); every aging step is one decrease-key
+        preemptions = -preempt_order
+        self.context_switches = preemptions
+        self.finish_run("priority_preemptive", admitted, dispatches, preemptions, idle_steps,
+                        admitted + preemptions + dispatches + aging_steps, {
+                            "sort": sorted_at - started, "schedule": perf_counter() - sorted_at})
 
     def round_robin(self, quantum):
-            """Round Robin Scheduling with time slicing"""
-            print("Round Robin Scheduling...")
-
-            # Initialize the log to record the execution of each time slice
-            self.execution_log = []
-
-            # Sort the processes by arrival time
-            queue = sorted(self.processes, key=lambda p: p.arrival_time)
-            current_time = 0
-
-            while queue:
-                has_executed = False  # Flag to indicate whether any process has executed at the current time
-                for process in list(queue):
-                    if process.arrival_time <= current_time:
-                        # Process can be executed
-
-                        # If the process's start_time has not been set, set it to the current time
-                        if process.start_time == -1:
-                            process.start_time = current_time
-                            process.response_time = process.start_time - process.arrival_time  # Calculate response time
-                            self.response_times.append(process.response_time)  # Add to response_times
-
-                        # Record the start time and time slice
-                        start_time = current_time
-                        time_slice = min(process.remaining_time, quantum)
-                        process.remaining_time -= time_slice
-                        current_time += time_slice
-                        has_executed = True
-
-                        # Log the execution details
-                        self.execution_log.append({
-                            "pid": process.pid,
-                            "start": start_time,
-                            "duration": time_slice,
-                            "color": process.color
-                        })
-
-                        # If the process is not finished, move it back to the queue
-                        if process.remaining_time > 0:
-                            queue.append(queue.pop(0))  # Move this process to the end of the queue
-                            self.context_switches += 1  # Count the context switch
-                            # print(f"Context switch at time {current_time}")
-                        else:
-                            # Process has completed
-                            process.completion_time = current_time
-                            process.turnaround_time = process.completion_time - process.arrival_time
-                            process.waiting_time = process.turnaround_time - process.burst_time
-                            queue.remove(process)
+        """Round Robin Scheduling with time slicing"""
+        if self.cores > 1:
+            self.run_smp("round_robin", quantum)
+            return
+        self.reset_run()
+
+        # Processes are admitted to the ready queue in arrival order
+        started = perf_counter()
+        arrivals = self.arrival_stream()
+        next_arrival = next(arrivals, None)
+        sorted_at = perf_counter()
+        ready_queue = deque()
+        current_time = 0
+        admitted = 0
+        dispatches = 0
+        idle_steps = 0
+
+        while ready_queue or next_arrival is not None:
+            while next_arrival is not None and next_arrival.arrival_time <= current_time:
+                ready_queue.append(next_arrival)
+                admitted += 1
+                next_arrival = next(arrivals, None)
+
+            if not ready_queue:
+                # No process is ready, skip the whole idle gap as a single idle slice
+                idle_until = max(current_time, next_arrival.arrival_time)
+                if self._record_log:
+                    self.execution_log.append(IDLE_PID, current_time, idle_until - current_time, None, 0)  # Idle slice
+                idle_steps += 1
+                current_time = idle_until
+                continue
+
+            process = ready_queue.popleft()
+            dispatches += 1
+            queue_length = len(ready_queue) + 1
+
+            # If the process's start_time has not been set, set it to the current time
+            if process.start_time == -1:
+                process.start_time = current_time
+                process.response_time = process.start_time - process.arrival_time  # Calculate response time
+                if self._record_series:
+                    self.response_times.append(process.response_time)  # Add to response_times
 
+            if ready_queue:
+                time_slice = min(process.remaining_time, quantum)
+            else:
+                # Nobody else is waiting, so the process keeps the CPU for whole quanta
+                # until the first quantum boundary at or after the next arrival
+                time_slice = process.remaining_time
+                if next_arrival is not None:
+                    quanta = max(1, -(-(next_arrival.arrival_time - current_time) // quantum))
+                    time_slice = min(time_slice, quanta * quantum)
+
+            # Record the start time and time slice
+            start_time = current_time
+            process.remaining_time -= time_slice
+            current_time += time_slice
+
+            # Log the execution details
+            if self._record_log:
+                self.execution_log.append(process.pid, start_time, time_slice, process.response_time, queue_length)
+
+            # Processes that arrived during the slice queue up ahead of the preempted one
+            while next_arrival is not None and next_arrival.arrival_time <= current_time:
+                ready_queue.append(next_arrival)
+                admitted += 1
+                next_arrival = next(arrivals, None)
+
+            if process.remaining_time > 0:
+                # If the process is not finished, move it to the end of the queue
+                ready_queue.append(process)
+                self.context_switches += 1  # Count the context switch
+            else:
+                # Process has completed
+                process.completion_time = current_time
+                process.turnaround_time = process.completion_time - process.arrival_time
+                process.waiting_time = process.turnaround_time - process.burst_time
+                if self.on_complete is not None:
+                    self.on_complete(process)
+        # Each requeue after an expired quantum is a preemption (and a context switch)
+        preemptions = self.context_switches
+        self.finish_run("round_robin", admitted, dispatches, preemptions, idle_steps,
+                        admitted + preemptions + dispatches, {
+                            "sort": sorted_at - started, "schedule": perf_counter() - sorted_at})
+
+    def mlfq(self, quanta=MLFQ_QUANTA, boost_interval=MLFQ_BOOST_INTERVAL):
+        """Multilevel Feedback Queue Scheduling with one level per entry of quanta.
+
+        Arrivals enter level 0. A process that uses up its level's quantum (summed over its
+        runs at that level) moves one level down; the last level is round robin. A ready
+        process on a higher level preempts a lower-level one, which goes back to the front
+        of its own level. Every boost_interval time units (None or 0 for never) all
+        processes return to level 0 with a fresh quantum. Levels are deques and a bitmap
+        of the non-empty ones finds the highest in O(1).
+
+        A boost is O(levels), not O(processes): each level is a deque of batches (deques of
+        processes), so boosting moves whole batches to level 0, and a process's level and
+        used time only count if they were set after the latest boost (its epoch).
+        """
+        if not quanta or min(quanta) <= 0:
+            raise ValueError(f"MLFQ needs at least one level and positive quanta, got {quanta!r}")
+        if self.cores > 1:
+            raise ValueError("MLFQ is only simulated on a single CPU")
+        self.reset_run()
+        started = perf_counter()
+        arrivals = self.arrival_stream()
+        next_arrival = next(arrivals, None)
+        sorted_at = perf_counter()
+        levels = [deque() for _ in quanta]  # Batches of processes per level; none is ever empty
+        last_level = len(quanta) - 1
+        occupied = 0  # Bit i is set while levels[i] is non-empty
+        queued = 0
+        level_of = {}  # Level of every admitted, unfinished process, valid if set in this epoch
+        used = {}  # Time each process has run on its current level, valid likewise
+        set_in = {}  # Epoch in which a process's level and used time were set
+        epoch = 0  # Number of boosts so far
+        next_boost = boost_interval or None
+        current_time = 0
+        running = None
+        expired = False  # The running process just used up its quantum
+        segment_start = 0
+        segment_queue_length = 0
+        admitted = 0
+        dispatches = 0
+        preemptions = 0
+        idle_steps = 0
+
+        while True:
+            while next_arrival is not None and next_arrival.arrival_time <= current_time:
+                if occupied & 1:
+                    levels[0][-1].append(next_arrival)
+                else:
+                    levels[0].append(deque((next_arrival,)))
+                    occupied |= 1
+                queued += 1
+                level_of[next_arrival] = 0
+                used[next_arrival] = 0
+                set_in[next_arrival] = epoch
+                admitted += 1
+                next_arrival = next(arrivals, None)
+
+            if next_boost is not None and next_boost <= current_time:
+                while next_boost <= current_time:
+                    next_boost += boost_interval
+                # Lower levels join level 0 behind its processes, keeping their order; every
+                # level and used time set before now is void
+                for level in range(1, last_level + 1):
+                    levels[0].extend(levels[level])
+                    levels[level].clear()
+                occupied = 1 if queued else 0
+                epoch += 1
+                if running is not None:
+                    level_of[running] = 0
+                    used[running] = 0
+                    set_in[running] = epoch
+                    expired = False
+
+            # Record the queue length (ready processes plus the running one)
+            if self._record_series:
+                self.queue_lengths.append(queued + (running is not None))
+
+            # The highest non-empty level is the lowest set bit of the bitmap. A higher level
+            # preempts; after an expired quantum so does the process's own (new) level, while
+            # with only lower levels waiting the process just keeps the CPU
+            if running is not None and occupied:
+                best = (occupied & -occupied).bit_length() - 1
+                level = level_of[running]
+                if best < level or (expired and best <= level):
+                    if self._record_log:
+                        self.execution_log.append(running.pid, segment_start, current_time - segment_start,
+                                                  running.response_time, segment_queue_length)
+                    if not occupied & 1 << level:
+                        levels[level].append(deque((running,)))
+                    elif expired:
+                        levels[level][-1].append(running)  # Behind the processes already on its new level
                     else:
-                        continue
-
-                if not has_executed:
-                    # If no processes can be executed, add an idle time slice
-                    self.execution_log.append({
-                        "pid": "I",
-                        "start": current_time,
-                        "duration": 1,
-                        "color": "#D3D3D3",  # Idle color
-                        "response_time": process.response_time,  # Add response time
-                        "queue_length": len(queue)  # Add the length of the queue
-
-                    })
-                    current_time += 1
-
+                        levels[level][0].appendleft(running)
+                    occupied |= 1 << level
+                    queued += 1
+                    preemptions += 1
+                    running = None
+            expired = False
+
+            if running is None:
+                if not occupied:
+                    if next_arrival is None:
+                        break
+                    # CPU is idle, skip the whole gap as a single idle slice
+                    idle_until = next_arrival.arrival_time
+                    if self._record_log:
+                        self.execution_log.append(IDLE_PID, current_time, idle_until - current_time, None, 0)
+                    idle_steps += 1
+                    current_time = idle_until
+                    continue
+                level = (occupied & -occupied).bit_length() - 1
+                batch = levels[level][0]
+                running = batch.popleft()
+                if not batch:
+                    levels[level].popleft()
+                    if not levels[level]:
+                        occupied &= ~(1 << level)
+                if set_in[running] != epoch:
+                    # Queued since before the latest boost: back on level 0 with a fresh quantum
+                    level_of[running] = 0
+                    used[running] = 0
+                    set_in[running] = epoch
+                queued -= 1
+                dispatches += 1
+                segment_start = current_time
+                segment_queue_length = queued + 1
+                if running.start_time == -1:
+                    running.start_time = current_time
+                    running.response_time = running.start_time - running.arrival_time
+                    if self._record_series:
+                        self.response_times.append(running.response_time)
+
+            # Run until the process completes, its quantum runs out, the next boost, or the
+            # next arrival if that could preempt it
+            level = level_of[running]
+            run_until = current_time + min(running.remaining_time, quanta[level] - used[running])
+            if next_arrival is not None and level > 0 and next_arrival.arrival_time < run_until:
+                run_until = next_arrival.arrival_time
+            if next_boost is not None and next_boost < run_until:
+                run_until = next_boost
+            running.remaining_time -= run_until - current_time
+            used[running] += run_until - current_time
+            current_time = run_until
+
+            if running.remaining_time <= 0:
+                if self._record_log:
+                    self.execution_log.append(running.pid, segment_start, current_time - segment_start,
+                                              running.response_time, segment_queue_length)
+                running.completion_time = current_time
+                running.turnaround_time = running.completion_time - running.arrival_time
+                running.waiting_time = running.turnaround_time - running.burst_time
+                if self.on_complete is not None:
+                    self.on_complete(running)
+                del level_of[running], used[running], set_in[running]
+                running = None
+            elif used[running] >= quanta[level]:
+                # Quantum used up: demote, and give up the CPU if anyone on its new level or above is ready
+                level_of[running] = min(level + 1, last_level)
+                used[running] = 0
+                expired = True
+        # Every preemption or demotion off the CPU is a context switch
+        self.context_switches = preemptions
+        self.finish_run("mlfq", admitted, dispatches, preemptions, idle_steps,
+                        admitted + preemptions + dispatches, {
+                            "sort": sorted_at - started, "schedule": perf_counter() - sorted_at})
 
     def get_context_switches(self):
         return self.context_switches
@@ -0,0 +1,340 @@
+# src/smp.py
+import heapq
+from collections import deque, namedtuple
+from execution_log import ExecutionLog
+
+# Ready-queue layouts: one queue shared by every core, or one queue per core
+QUEUE_GLOBAL = "global"
+QUEUE_PER_CORE = "per_core"
+QUEUE_MODES = (QUEUE_GLOBAL, QUEUE_PER_CORE)
+
+# Ready-queue order of each Scheduler policy (None keeps arrival order) and whether a
+# shorter arrival preempts a running process
+POLICY_ORDER = {
+    "fcfs": (None, False),
+    "sjf_non_preemptive": (lambda p: p.burst_time, False),
+    "sjf_preemptive": (lambda p: p.remaining_time, True),
+    "priority_scheduling": (lambda p: p.priority, False),
+    "round_robin": (None, False),
+}
+
+# One point of a throughput-versus-core-count curve
+ScalingPoint = namedtuple("ScalingPoint", [
+    "cores", "throughput", "makespan", "avg_waiting_time", "avg_turnaround_time", "avg_utilization",
+])
+
+
+class RunQueue:
+    """Ready queue of one policy: a FIFO deque, or a heap of (key, tie breaker, process)"""
+    __slots__ = ("key", "items")
+
+    def __init__(self, key):
+        self.key = key
+        self.items = deque() if key is None else []
+
+    def push(self, process, tie):
+        if self.key is None:
+            self.items.append(process)
+        else:
+            heapq.heappush(self.items, (self.key(process), tie, process))
+
+    def pop(self):
+        """Next process in policy order"""
+        return self.items.popleft() if self.key is None else heapq.heappop(self.items)[2]
+
+    def steal(self):
+        """Process handed to another core: the newest arrival of a FIFO, the next in order of a heap"""
+        return self.items.pop() if self.key is None else heapq.heappop(self.items)[2]
+
+    def best_key(self):
+        return self.items[0][0]
+
+    def __len__(self):
+        return len(self.items)
+
+
+class SMPEngine:
+    """Event-driven simulation of one Scheduler policy on several identical cores.
+
+    With QUEUE_GLOBAL every core takes work from one shared ready queue. With
+    QUEUE_PER_CORE each arrival joins the least loaded core's queue, a core that runs dry
+    steals from the longest queue (work_stealing), and every balance_interval time units
+    queues that differ by more than one process are evened out. Core events (completions,
+    quantum expiries) sit in a heap, so an event costs O(log cores) apart from arrival
+    placement and balancing, which look at every core.
+
+    context_switches counts preemptions: a process taken off a core before it finished.
+    With one core the per-process results match the single-CPU Scheduler methods.
+    """
+
+    def __init__(self, cores, policy, quantum=None, queues=QUEUE_GLOBAL, balance_interval=10,
+                 work_stealing=True, record_log=True, on_complete=None):
+        if cores < 1:
+            raise ValueError(f"Need at least one core, got {cores}")
+        if queues not in QUEUE_MODES:
+            raise ValueError(f"Unknown queue layout: {queues!r} (expected one of {QUEUE_MODES})")
+        if policy not in POLICY_ORDER:
+            raise ValueError(f"Unknown policy: {policy!r}")
+        self.cores = cores
+        self.policy = policy
+        self.key, self.preemptive = POLICY_ORDER[policy]
+        self.quantum = quantum if policy == "round_robin" else None
+        self.per_core = queues == QUEUE_PER_CORE
+        self.balance_interval = balance_interval
+        self.work_stealing = work_stealing
+        self.record_log = record_log
+        self.on_complete = on_complete
+        self.queues = [RunQueue(self.key) for _ in range(cores if self.per_core else 1)]
+        self.core_logs = [ExecutionLog() for _ in range(cores)]
+        self.busy_time = [0] * cores
+        self.utilization = [0.0] * cores
+        self.makespan = 0
+        self.completed = 0
+        self.dispatches = 0
+        self.preemptions = 0
+        self.migrations = 0  # Dispatches onto a different core than the process last ran on
+        self.steals = 0
+        self.balance_moves = 0
+        self.idle_steps = 0  # Times a core ran out of work
+        self.queue_operations = 0
+
+    def queue_for(self, core):
+        return self.queues[core] if self.per_core else self.queues[0]
+
+    def run(self, arrivals):
+        """Schedule an iterator of processes in arrival order, filling in their metrics"""
+        arrivals = iter(arrivals)
+        next_arrival = next(arrivals, None)
+        cores = range(self.cores)
+        running = [None] * self.cores
+        progress_at = [0] * self.cores  # When each running process's remaining_time was last updated
+        segment_start = [0] * self.cores
+        segment_queue_length = [0] * self.cores
+        version = [0] * self.cores  # Bumped whenever a core's pending event is replaced
+        events = []  # (time, core, version) of the next completion or quantum expiry per core
+        idle = set(cores)
+        last_core = {}
+        arrival_order = 0
+        preempt_order = 0
+        queued = 0  # Processes waiting in any ready queue
+        next_balance = self.balance_interval if self.per_core and self.balance_interval else None
+        quantum = self.quantum
+
+        def remaining(core, time):
+            return running[core].remaining_time - (time - progress_at[core])
+
+        def sync(core, time):
+            """Charge the running process for the time it has run since the last update"""
+            running[core].remaining_time -= time - progress_at[core]
+            progress_at[core] = time
+
+        def close_segment(core, time):
+            process = running[core]
+            sync(core, time)
+            self.busy_time[core] += time - segment_start[core]
+            if self.record_log and time > segment_start[core]:
+                self.core_logs[core].append(process.pid, segment_start[core], time - segment_start[core],
+                                            process.response_time, segment_queue_length[core])
+
+        def plan(core, time):
+            """Queue the core's next event: completion, or the end of its quantum"""
+            process = running[core]
+            end = time + process.remaining_time
+            if quantum is not None:
+                end = min(end, time + quantum)
+            version[core] += 1
+            heapq.heappush(events, (end, core, version[core]))
+
+        def dispatch(core, process, time):
+            running[core] = process
+            progress_at[core] = segment_start[core] = time
+            segment_queue_length[core] = len(self.queue_for(core)) + 1
+            if process.start_time == -1:
+                process.start_time = time
+                process.response_time = time - process.arrival_time
+            if last_core.get(process, core) != core:
+                self.migrations += 1
+            last_core[process] = core
+            self.dispatches += 1
+            plan(core, time)
+
+        def preempt(core, time):
+            nonlocal preempt_order, queued
+            close_segment(core, time)
+            process = running[core]
+            running[core] = None
+            idle.add(core)
+            version[core] += 1  # Drop its pending event
+            # Like the single-CPU schedulers, a preempted process goes ahead of waiting
+            # processes with the same key
+            preempt_order -= 1
+            self.queue_for(core).push(process, preempt_order)
+            queued += 1
+            self.queue_operations += 1
+            self.preemptions += 1
+
+        def place(process):
+            """Queue an arrival: on the shared queue, or the least loaded core's queue"""
+            nonlocal arrival_order, queued
+            if self.per_core:
+                core = min(cores, key=lambda c: len(self.queues[c]) + (running[c] is not None))
+                self.queues[core].push(process, arrival_order)
+            else:
+                self.queues[0].push(process, arrival_order)
+            arrival_order += 1
+            queued += 1
+            self.queue_operations += 1
+
+        def take(core):
+            """Next process for an idle core, stealing from the longest queue if its own is empty"""
+            nonlocal queued
+            queue = self.queue_for(core)
+            if len(queue):
+                queued -= 1
+                self.queue_operations += 1
+                return queue.pop()
+            if self.per_core and self.work_stealing:
+                victim = max(self.queues, key=len)
+                if len(victim):
+                    queued -= 1
+                    self.steals += 1
+                    self.queue_operations += 1
+                    return victim.steal()
+            return None
+
+        def balance():
+            nonlocal arrival_order
+            while True:
+                longest = max(self.queues, key=len)
+                shortest = min(self.queues, key=len)
+                if len(longest) - len(shortest) <= 1:
+                    return
+                shortest.push(longest.steal(), arrival_order)  # Queues behind what is already there
+                arrival_order += 1
+                self.balance_moves += 1
+                self.queue_operations += 2
+
+        while True:
+            while events and events[0][2] != version[events[0][1]]:
+                heapq.heappop(events)  # Stale: the core was preempted or redispatched
+            time = events[0][0] if events else None
+            if next_arrival is not None and (time is None or next_arrival.arrival_time < time):
+                time = next_arrival.arrival_time
+            if time is None:
+                break
+            balancing = False
+            if next_balance is not None:
+                if queued and next_balance <= time:
+                    time = next_balance
+                    balancing = True
+                while next_balance <= time:
+                    next_balance += self.balance_interval
+
+            # Completions and quantum expiries due now
+            expired = []
+            freed = []
+            while events and events[0][0] == time:
+                _, core, event_version = heapq.heappop(events)
+                if event_version != version[core]:
+                    continue
+                process = running[core]
+                if remaining(core, time) > 0:
+                    expired.append(core)
+                    continue
+                close_segment(core, time)
+                process.completion_time = time
+                process.turnaround_time = time - process.arrival_time
+                process.waiting_time = process.turnaround_time - process.burst_time
+                last_core.pop(process, None)  # It never runs again, so do not hold on to it
+                running[core] = None
+                idle.add(core)
+                freed.append(core)
+                self.completed += 1
+                self.makespan = max(self.makespan, time)
+                if self.on_complete is not None:
+                    self.on_complete(process)
+
+            # Arrivals queue up ahead of the processes whose quantum just expired
+            while next_arrival is not None and next_arrival.arrival_time <= time:
+                place(next_arrival)
+                next_arrival = next(arrivals, None)
+
+            for core in expired:
+                if len(self.queue_for(core)):
+                    preempt(core, time)
+                else:
+                    # Nobody is waiting for this core: keep running for another quantum
+                    sync(core, time)
+                    plan(core, time)
+
+            if balancing:
+                balance()
+
+            # Hand work to idle cores, lowest core first
+            if queued:
+                for core in sorted(idle):
+                    process = take(core)
+                    if process is not None:
+                        idle.discard(core)
+                        dispatch(core, process, time)
+                        if not queued:
+                            break
+            self.idle_steps += sum(1 for core in freed if running[core] is None)
+
+            # Preemptive policies: a strictly better ready process displaces the running one
+            # with the most work left among the cores sharing its queue
+            if self.preemptive and queued:
+                if self.per_core:
+                    groups = [[core] for core in cores if running[core] is not None and len(self.queues[core])]
+                else:
+                    groups = [list(cores)]
+                for group in groups:
+                    queue = self.queue_for(group[0])
+                    while len(queue):
+                        busy = [c for c in group if running[c] is not None]
+                        if not busy:
+                            break
+                        core = max(busy, key=lambda c: remaining(c, time))
+                        if queue.best_key() >= remaining(core, time):
+                            break
+                        preempt(core, time)
+                        idle.discard(core)
+                        queued -= 1
+                        self.queue_operations += 1
+                        dispatch(core, queue.pop(), time)
+
+        if self.makespan:
+            self.utilization = [busy / self.makespan for busy in self.busy_time]
+        return self
+
+
+def core_scaling(processes, policy, core_counts=(1, 2, 4, 8, 16, 32, 64, 128), quantum=None,
+                 queues=QUEUE_GLOBAL, on_point=None, **options):
+    """Throughput (completed processes per time unit) and averages of a workload per core count.
+
+    Every core count runs on its own fresh processes built from the workload (anything
+    runner.workload_snapshot accepts). Returns one ScalingPoint per core count. on_point
+    sees each point as it is done; an exception it raises stops the run.
+    """
+    from process import Process
+    from runner import workload_snapshot
+    snapshot = workload_snapshot(processes)
+    if not isinstance(snapshot, tuple):  # A ProcessTable
+        snapshot = tuple((p.pid, p.arrival_time, p.burst_time, p.priority) for p in snapshot.to_processes())
+    order = (lambda p: (p.arrival_time, p.priority)) if policy == "priority_scheduling" else (lambda p: p.arrival_time)
+    points = []
+    for cores in core_counts:
+        fresh = sorted((Process(*spec) for spec in snapshot), key=order)
+        engine = SMPEngine(cores, policy, quantum, queues, record_log=False, **options).run(fresh)
+        count = len(fresh) or 1
+        points.append(ScalingPoint(
+            cores=cores,
+            throughput=engine.completed / engine.makespan if engine.makespan else 0.0,
+            makespan=engine.makespan,
+            avg_waiting_time=sum(p.waiting_time for p in fresh) / count,
+            avg_turnaround_time=sum(p.turnaround_time for p in fresh) / count,
+            avg_utilization=sum(engine.utilization) / cores,
+        ))
+        if on_point is not None:
+            on_point(points[-1])
+    return points
@@ -0,0 +1,107 @@
+# src/sweep.py
+from collections import namedtuple
+from process import Process
+from process_table import ProcessTable, average_metrics, reset_states
+from runner import workload_snapshot
+from scheduler import RECORD_NONE, Scheduler
+
+# Round Robin metrics for one quantum
+SweepPoint = namedtuple(
+    "SweepPoint",
+    ["quantum", "avg_waiting_time", "avg_turnaround_time", "avg_response_time", "context_switches"],
+)
+
+# Objectives the Pareto front minimizes
+PARETO_OBJECTIVES = ("avg_waiting_time", "avg_response_time", "context_switches")
+
+
+class QuantumSweep:
+    """Evaluates Scheduler.round_robin for many quanta on one arrival-sorted copy of a workload"""
+
+    def __init__(self, processes, on_point=None):
+        snapshot = workload_snapshot(processes)
+        if isinstance(snapshot, ProcessTable):
+            self.workload = snapshot
+            self.workload.sort()
+        else:
+            self.workload = [Process(*spec) for spec in snapshot]
+            self.workload.sort(key=lambda p: p.arrival_time)  # round_robin's own sort is then linear
+        self.scheduler = Scheduler(self.workload, recording=RECORD_NONE)
+        self.points = {}  # quantum -> SweepPoint, so no quantum is simulated twice
+        self.on_point = on_point  # Called with each newly evaluated SweepPoint
+        # With a quantum of at least the longest burst no process can be preempted, so the
+        # schedule is exactly FCFS and every larger quantum gives the same result
+        self.fcfs_quantum = max((p.burst_time for p in self.workload), default=1)
+
+    def evaluate(self, quantum):
+        """Run Round Robin with the given quantum (or reuse an earlier result)"""
+        if quantum not in self.points:
+            reset_states(self.workload)
+            self.scheduler.round_robin(quantum)
+            self.points[quantum] = SweepPoint(
+                quantum=quantum, context_switches=self.scheduler.context_switches,
+                **average_metrics(self.workload)
+            )
+            if self.on_point is not None:
+                self.on_point(self.points[quantum])
+        return self.points[quantum]
+
+    def run(self, quanta):
+        """Evaluate quanta in increasing order, stopping at the first one that guarantees FCFS"""
+        results = []
+        for quantum in sorted(set(quanta)):
+            results.append(self.evaluate(quantum))
+            if quantum >= self.fcfs_quantum:
+                break
+        return results
+
+    def search(self, metric="avg_waiting_time"):
+        """Adaptive search: double the quantum up to the FCFS quantum, then bisect around the best one"""
+        quantum = 1
+        while quantum < self.fcfs_quantum:
+            self.evaluate(quantum)
+            quantum *= 2
+        self.evaluate(self.fcfs_quantum)
+
+        def best_of(candidates):
+            return min(candidates, key=lambda q: (getattr(self.points[q], metric), q))
+
+        best = best_of(self.points)
+        while True:
+            evaluated = sorted(self.points)
+            position = evaluated.index(best)
+            lower = evaluated[position - 1] if position > 0 else best
+            upper = evaluated[position + 1] if position + 1 < len(evaluated) else best
+            candidates = {(lower + best) // 2, (best + upper) // 2} - set(self.points)
+            if not candidates:
+                break
+            for candidate in candidates:
+                self.evaluate(candidate)
+            best = best_of(self.points)
+        return self.sorted_points()
+
+    def sorted_points(self):
+        return [self.points[quantum] for quantum in sorted(self.points)]
+
+
+def pareto_front(points, objectives=PARETO_OBJECTIVES):
+    """Points not dominated on the objectives (all minimized), in quantum order"""
+    def dominates(a, b):
+        a_values = [getattr(a, name) for name in objectives]
+        b_values = [getattr(b, name) for name in objectives]
+        return all(x <= y for x, y in zip(a_values, b_values)) and a_values != b_values
+
+    return [p for p in points if not any(dominates(other, p) for other in points)]
+
+
+def quantum_sweep(processes, quanta=None, metric="avg_waiting_time", on_point=None):
+    """Sweep Round Robin quanta over a workload and return (points, pareto_front).
+
+    With quanta given, they are evaluated in increasing order up to the first quantum
+    that is at least the longest burst (beyond it the schedule is always FCFS); without, an adaptive search looks for the quantum minimizing
+    `metric`. Points are SweepPoint records sorted by quantum. on_point sees each point as
+    it is evaluated; an exception it raises stops the sweep.
+    """
+    sweep = QuantumSweep(processes, on_point)
+    points = sweep.run(quanta) if quanta is not None else sweep.search(metric)
+    return points, pareto_front(points)
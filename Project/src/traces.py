@@ -0,0 +1,153 @@
+# src/traces.py
+import csv
+import gzip
+import json
+from process import Process
+from scheduler import RECORD_NONE, Scheduler
+
+# Columns of a job trace; priority is optional and defaults to 0
+TRACE_FIELDS = ("pid", "arrival_time", "burst_time", "priority")
+
+# Columns written for every completed job
+RESULT_FIELDS = ("pid", "arrival_time", "burst_time", "priority", "start_time",
+                 "completion_time", "waiting_time", "turnaround_time", "response_time")
+
+
+def open_text(path, mode="r"):
+    """Open a trace or result file as text, transparently (de)compressing .gz files"""
+    if str(path).endswith(".gz"):
+        return gzip.open(path, mode + "t", newline="")
+    return open(path, mode, newline="")
+
+
+def trace_format(path):
+    """'csv' or 'jsonl', judged by the file extension (ignoring a trailing .gz)"""
+    name = str(path)
+    if name.endswith(".gz"):
+        name = name[:-3]
+    if name.endswith(".csv"):
+        return "csv"
+    if name.endswith(".jsonl") or name.endswith(".json"):
+        return "jsonl"
+    raise ValueError(f"Unsupported trace format: {path} (expected .csv or .jsonl)")
+
+
+def read_records(path):
+    """Yield one dict per job from a CSV (with header) or JSONL trace"""
+    with open_text(path) as file:
+        if trace_format(path) == "csv":
+            yield from csv.DictReader(file)
+        else:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def read_trace(path):
+    """Yield Process objects from an arrival-sorted trace, one job at a time.
+
+    Only the current line is held in memory, so traces of any size can be fed to a
+    Scheduler created with arrival_sorted=True. Raises ValueError if arrivals go backwards.
+    """
+    last_arrival = None
+    for line_number, record in enumerate(read_records(path), start=1):
+        try:
+            process = Process(
+                record["pid"],
+                int(record["arrival_time"]),
+                int(record["burst_time"]),
+                int(record.get("priority") or 0),
+            )
+        except (KeyError, ValueError) as error:
+            raise ValueError(f"{path}: job {line_number}: invalid record {record!r}") from error
+        if last_arrival is not None and process.arrival_time < last_arrival:
+            raise ValueError(f"{path}: job {line_number}: trace is not sorted by arrival time")
+        last_arrival = process.arrival_time
+        yield process
+
+
+def write_trace(path, processes):
+    """Write processes as an arrival-sorted trace (CSV or JSONL by extension)"""
+    processes = sorted(processes, key=lambda p: p.arrival_time)
+    with open_text(path, "w") as file:
+        if trace_format(path) == "csv":
+            writer = csv.writer(file)
+            writer.writerow(TRACE_FIELDS)
+            for p in processes:
+                writer.writerow((p.pid, p.arrival_time, p.burst_time, p.priority))
+        else:
+            for p in processes:
+                file.write(json.dumps(dict(zip(TRACE_FIELDS, (p.pid, p.arrival_time, p.burst_time, p.priority)))) + "\n")
+
+
+class ResultWriter:
+    """Streams each completed job to a CSV/JSONL file and keeps running totals for the averages"""
+
+    def __init__(self, path=None):
+        self.path = path
+        self.file = None
+        self.csv_writer = None
+        self.count = 0
+        self.total_waiting_time = 0
+        self.total_turnaround_time = 0
+        self.total_response_time = 0
+        if path is not None:
+            self.file = open_text(path, "w")
+            if trace_format(path) == "csv":
+                self.csv_writer = csv.writer(self.file)
+                self.csv_writer.writerow(RESULT_FIELDS)
+
+    def write(self, process):
+        """Record one completed process; meant to be passed as Scheduler(on_complete=...)"""
+        self.count += 1
+        self.total_waiting_time += process.waiting_time
+        self.total_turnaround_time += process.turnaround_time
+        if process.response_time is not None:
+            self.total_response_time += process.response_time
+        if self.file is not None:
+            row = [getattr(process, field) for field in RESULT_FIELDS]
+            if self.csv_writer is not None:
+                self.csv_writer.writerow(row)
+            else:
+                self.file.write(json.dumps(dict(zip(RESULT_FIELDS, row))) + "\n")
+
+    def summary(self):
+        """Averages over every job written so far"""
+        count = self.count or 1
+        return {
+            "processes": self.count,
+            "avg_waiting_time": self.total_waiting_time / count,
+            "avg_turnaround_time": self.total_turnaround_time / count,
+            "avg_response_time": self.total_response_time / count,
+        }
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def replay_trace(trace_path, method, quantum=None, results_path=None):
+    """Replay an arrival-sorted trace through one Scheduler policy with bounded memory.
+
+    `method` is a Scheduler method name such as "fcfs" or "round_robin". Jobs are read
+    lazily, only the live ready set is kept, and each finished job is streamed to
+    results_path (if given) instead of being kept. Returns the metric averages.
+    """
+    with ResultWriter(results_path) as writer:
+        # Per-job results go to the writer, nothing accumulates in memory
+        scheduler = Scheduler(read_trace(trace_path), arrival_sorted=True, on_complete=writer.write,
+                              recording=RECORD_NONE)
+        if quantum is not None:
+            getattr(scheduler, method)(quantum)
+        else:
+            getattr(scheduler, method)()
+        summary = writer.summary()
+    summary["context_switches"] = scheduler.context_switches
+    return summary
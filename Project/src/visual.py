@@ -1,7 +1,7 @@
 import matplotlib.pyplot as plt
-from scheduler import Scheduler
-from matplotlib.animation import FuncAnimation
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from montecarlo import monte_carlo_comparison
+from result_cache import ResultCache
+from runner import run_all
 import numpy as np
 class Visualizer:
     def __init__(self):
@@ -11,54 +11,32 @@ class Visualizer:
         self.ani = None 
         self.figure = None 
         self.canvas = None
+        self.cache = ResultCache()  # Comparison results by (workload fingerprint, algorithm, quantum)
+
+    def run_all_algorithms(self, task_set, max_workers=None, on_result=None):
+        """Run all algorithms on the same task set (a list of processes or a ProcessTable) and collect performance data
+
+        Every algorithm/quantum combination runs as an independent job on its own copy of
+        the task set (see runner.run_all), so the caller's processes are left untouched. Runs
+        already done for the same workload are served from self.cache. on_result sees each
+        run's result as it arrives (see runner.run_all).
+        """
+        results = run_all(task_set, max_workers=max_workers, cache=self.cache, on_result=on_result)
+        self.performance_metrics = [result._asdict() for result in results]
+        return self.performance_metrics
+
+    def run_monte_carlo(self, **options):
+        """Compare all algorithms over many random workloads; see montecarlo.monte_carlo_comparison"""
+        self.performance_metrics = monte_carlo_comparison(**options)
+        return self.performance_metrics
+
+    def error_bars(self, metric):
+        """Confidence interval half-widths for a metric, or None for a single-workload comparison"""
+        key = f"{metric}_ci"
+        if not self.performance_metrics or key not in self.performance_metrics[0]:
+            return None
+        return [algo[key] for algo in self.performance_metrics]
 
-    def run_all_algorithms(self, task_set, scheduler):
-        """Run all algorithms on the same task set and collect performance data"""
-        
-        # List of algorithms with an indication of whether they are Round Robin
-        algorithms = [
-            ("FCFS", scheduler.fcfs, None),  # No quantum for non-Round Robin
-            ("SJF-Non", scheduler.sjf_non_preemptive, None),
-            ("SJF-Pree", scheduler.sjf_preemptive, None),
-            ("Priority Scheduling", scheduler.priority_scheduling, None),
-            ("RR", scheduler.round_robin, [1, 2, 3]),  # Round Robin with quantum values
-        ]
-        
-        self.performance_metrics = []  # To store performance data for each algorithm
-
-        # Run each algorithm and collect performance metrics
-        for algo_name, algo_func, quantum_values in algorithms:
-            # Reset the state of each task before running a new algorithm
-            if quantum_values:  # If the algorithm is Round Robin (has quantum values)
-                for quantum in quantum_values:
-                    for task in task_set:
-                         task.reset_state()
-                    algo_func(quantum)  # Run Round Robin with the current quantum value
-                    avg_waiting_time = sum(task.waiting_time for task in task_set) / len(task_set)
-                    avg_turnaround_time = sum(task.turnaround_time for task in task_set) / len(task_set)
-                    avg_response_time = sum(task.response_time for task in task_set) / len(task_set)
-
-                    self.performance_metrics.append({
-                        "name": f"{algo_name} (Quantum {quantum})",
-                        "avg_waiting_time": avg_waiting_time,
-                        "avg_turnaround_time": avg_turnaround_time,
-                        "avg_response_time": avg_response_time
-                    })
-            else:  # For non-Round Robin algorithms
-                for task in task_set:
-                    task.reset_state() 
-                algo_func()  # Run the non-Round Robin algorithm
-                avg_waiting_time = sum(task.waiting_time for task in task_set) / len(task_set)
-                avg_turnaround_time = sum(task.turnaround_time for task in task_set) / len(task_set)
-                avg_response_time = sum(task.response_time for task in task_set) / len(task_set)
-
-                # Store the performance metrics for non-Round Robin algorithms
-                self.performance_metrics.append({
-                    "name": algo_name,
-                    "avg_waiting_time": avg_waiting_time,
-                    "avg_turnaround_time": avg_turnaround_time,
-                    "avg_response_time": avg_response_time
-                })
     def plot_avg_waiting_time(self):
         """Plot Average Waiting Time comparison"""
         if hasattr(self, "current_gantt_window") and self.current_gantt_window is not None:
@@ -70,7 +48,8 @@ class Visualizer:
         avg_waiting_times = [algo['avg_waiting_time'] for algo in self.performance_metrics]
 
         self.current_figure = plt.figure() 
-        bars = plt.bar(algorithms, avg_waiting_times, color='skyblue')
+        bars = plt.bar(algorithms, avg_waiting_times, color='skyblue',
+                       yerr=self.error_bars('avg_waiting_time'), capsize=5)
         plt.title("Average Waiting Time", fontsize=15, fontweight='bold')
         plt.xlabel("Algorithms", fontsize=14, fontweight='bold')
         plt.ylabel("Average Waiting Time", fontsize=14, fontweight='bold')
@@ -92,7 +71,8 @@ class Visualizer:
         avg_turnaround_times = [algo['avg_turnaround_time'] for algo in self.performance_metrics]
 
         self.current_figure = plt.figure()
-        bars = plt.bar(algorithms, avg_turnaround_times, color='lightgreen')
+        bars = plt.bar(algorithms, avg_turnaround_times, color='lightgreen',
+                       yerr=self.error_bars('avg_turnaround_time'), capsize=5)
         plt.title("Average Turnaround Time", fontsize=15, fontweight='bold')
         plt.xlabel("Algorithms", fontsize=14, fontweight='bold')
         plt.ylabel("Average Turnaround Time", fontsize=14, fontweight='bold')
@@ -113,7 +93,8 @@ class Visualizer:
         avg_response_times = [algo['avg_response_time'] for algo in self.performance_metrics]
 
         self.current_figure = plt.figure()
-        bars = plt.bar(algorithms, avg_response_times, color='orange')
+        bars = plt.bar(algorithms, avg_response_times, color='orange',
+                       yerr=self.error_bars('avg_response_time'), capsize=5)
         plt.title("Average Response Time", fontsize=15, fontweight='bold')
         plt.xlabel("Algorithms", fontsize=14, fontweight='bold')
         plt.ylabel("Average Response Time", fontsize=14, fontweight='bold')
@@ -138,7 +119,8 @@ class Visualizer:
         self.current_figure, axs = plt.subplots(3, 1, figsize=(6, 13))
 
         # Average Waiting Time
-        bars = axs[0].bar(algorithms, avg_waiting_times, color='skyblue')
+        bars = axs[0].bar(algorithms, avg_waiting_times, color='skyblue',
+                          yerr=self.error_bars('avg_waiting_time'), capsize=4)
         axs[0].set_title("Average Waiting Time Comparison", fontsize=14, fontweight='bold')
         axs[0].set_xlabel("Algorithms", fontsize=12)
         axs[0].set_ylabel("Average Waiting Time", fontsize=12)
@@ -149,7 +131,8 @@ class Visualizer:
                         f'{bar.get_height():.2f}', ha='center', va='bottom', fontsize=12)
 
         # Average Turnaround Time
-        bars = axs[1].bar(algorithms, avg_turnaround_times, color='lightgreen')
+        bars = axs[1].bar(algorithms, avg_turnaround_times, color='lightgreen',
+                          yerr=self.error_bars('avg_turnaround_time'), capsize=4)
         axs[1].set_title("Average Turnaround Time", fontsize=15, fontweight='bold')
         axs[1].set_xlabel("Algorithms", fontsize=12)
         axs[1].set_ylabel("Average Turnaround Time", fontsize=12)
@@ -160,7 +143,8 @@ class Visualizer:
                         f'{bar.get_height():.2f}', ha='center', va='bottom', fontsize=12)
 
         # Average Response Time
-        bars = axs[2].bar(algorithms, avg_response_times, color='orange')
+        bars = axs[2].bar(algorithms, avg_response_times, color='orange',
+                          yerr=self.error_bars('avg_response_time'), capsize=4)
         axs[2].set_title("Average Response Time Comparison", fontsize=14, fontweight='bold')
         axs[2].set_xlabel("Algorithms", fontsize=12)
         axs[2].set_ylabel("Average Response Time", fontsize=12)
@@ -174,6 +158,60 @@ class Visualizer:
         plt.subplots_adjust(hspace=1.0)
         plt.show()
 
+    def plot_quantum_sweep(self, points, front=()):
+        """Plot Round Robin metrics against the time quantum, highlighting the Pareto front"""
+        self.close_previous_figure()
+        quanta = [point.quantum for point in points]
+
+        self.current_figure, ax = plt.subplots(figsize=(9, 5))
+        ax.plot(quanta, [p.avg_waiting_time for p in points], marker='o', color='skyblue', label="Average Waiting Time")
+        ax.plot(quanta, [p.avg_turnaround_time for p in points], marker='o', color='lightgreen', label="Average Turnaround Time")
+        ax.plot(quanta, [p.avg_response_time for p in points], marker='o', color='orange', label="Average Response Time")
+        if front:
+            ax.scatter([p.quantum for p in front], [p.avg_waiting_time for p in front], s=120,
+                       facecolors='none', edgecolors='red', linewidths=2, zorder=3, label="Pareto Front")
+        ax.set_title("Round Robin Quantum Sweep", fontsize=15, fontweight='bold')
+        ax.set_xlabel("Time Quantum", fontsize=14, fontweight='bold')
+        ax.set_ylabel("Time", fontsize=14, fontweight='bold')
+
+        # Context switches share the x axis on their own scale
+        switches_ax = ax.twinx()
+        switches_ax.plot(quanta, [p.context_switches for p in points], linestyle='--', color='grey', label="Context Switches")
+        switches_ax.set_ylabel("Context Switches", fontsize=14, fontweight='bold')
+
+        lines, labels = ax.get_legend_handles_labels()
+        switch_lines, switch_labels = switches_ax.get_legend_handles_labels()
+        ax.legend(lines + switch_lines, labels + switch_labels, loc='upper right')
+        plt.tight_layout()
+        plt.show()
+
+    def plot_core_scaling(self, points, title="Throughput vs. Core Count"):
+        """Plot throughput and average utilization of smp.core_scaling points against the core count"""
+        self.close_previous_figure()
+        cores = [point.cores for point in points]
+
+        self.current_figure, ax = plt.subplots(figsize=(9, 5))
+        ax.plot(cores, [p.throughput for p in points], marker='o', color='skyblue', label="Throughput")
+        ax.set_xscale('log', base=2)
+        ax.set_xticks(cores)
+        ax.set_xticklabels([str(c) for c in cores])
+        ax.set_title(title, fontsize=15, fontweight='bold')
+        ax.set_xlabel("Cores", fontsize=14, fontweight='bold')
+        ax.set_ylabel("Processes per Time Unit", fontsize=14, fontweight='bold')
+
+        # Utilization shares the x axis on a 0-100% scale
+        utilization_ax = ax.twinx()
+        utilization_ax.plot(cores, [100 * p.avg_utilization for p in points], linestyle='--', color='grey',
+                            label="Average Utilization")
+        utilization_ax.set_ylim(0, 105)
+        utilization_ax.set_ylabel("Utilization (%)", fontsize=14, fontweight='bold')
+
+        lines, labels = ax.get_legend_handles_labels()
+        utilization_lines, utilization_labels = utilization_ax.get_legend_handles_labels()
+        ax.legend(lines + utilization_lines, labels + utilization_labels, loc='center right')
+        plt.tight_layout()
+        plt.show()
+
     def close_previous_figure(self):
         """Close the currently open figure, if any"""
         plt.close(self.current_gantt_window)
@@ -0,0 +1,69 @@
+# src/workload.py
+import hashlib
+from collections import namedtuple
+from process import Process
+from process_table import ProcessTable
+
+# Inputs of one process; never changed by a run
+ProcessSpec = namedtuple("ProcessSpec", ["pid", "arrival_time", "burst_time", "priority"])
+
+
+def workload_fingerprint(processes):
+    """Content hash of a workload's inputs (pid, arrival, burst, priority), independent of run state.
+
+    Processes are hashed in stable arrival order, the order every policy consumes them in,
+    so a list that fcfs sorted in place keeps its fingerprint. A WorkloadSpec hashes once.
+    """
+    if isinstance(processes, WorkloadSpec):
+        return processes.fingerprint
+    digest = hashlib.blake2b(digest_size=16)
+    if isinstance(processes, ProcessTable):
+        order = processes.arrival_time.argsort(kind="stable")
+        for column in (processes.pid, processes.arrival_time, processes.burst_time, processes.priority):
+            digest.update(column.dtype.str.encode())
+            digest.update(column[order].tobytes())
+    else:
+        processes = sorted(processes, key=lambda p: p.arrival_time)
+        digest.update(repr([(p.pid, p.arrival_time, p.burst_time, p.priority) for p in processes]).encode())
+    return digest.hexdigest()
+
+
+class WorkloadSpec:
+    """Immutable workload: the ProcessSpecs of its processes, in input order.
+
+    Runs never touch a spec; instantiate() hands each run its own fresh Process objects
+    (the per-run state). Keeping, resetting or reloading a workload is therefore just
+    keeping a reference, with no copying.
+    """
+    __slots__ = ("specs", "_fingerprint")
+
+    def __init__(self, specs=()):
+        self.specs = tuple(ProcessSpec(*spec) for spec in specs)
+        self._fingerprint = None
+
+    @classmethod
+    def from_processes(cls, processes):
+        return cls((p.pid, p.arrival_time, p.burst_time, p.priority) for p in processes)
+
+    def add(self, pid, arrival_time, burst_time, priority):
+        """New workload with one more process"""
+        return WorkloadSpec(self.specs + (ProcessSpec(pid, arrival_time, burst_time, priority),))
+
+    def instantiate(self):
+        """Fresh Process objects holding the state of a new run"""
+        return [Process(*spec) for spec in self.specs]
+
+    @property
+    def fingerprint(self):
+        if self._fingerprint is None:
+            self._fingerprint = workload_fingerprint(self.specs)
+        return self._fingerprint
+
+    def has_pid(self, pid):
+        return any(spec.pid == pid for spec in self.specs)
+
+    def __len__(self):
+        return len(self.specs)
+
+    def __iter__(self):
+        return iter(self.specs)